@@ -24,9 +24,13 @@ actor BatchAnalyzer {
             throw BatchAnalysisError.insufficientPhotos
         }
 
+        // One area average per image feeds the exposure, white balance and outlier checks
+        let averages = images.map { averageColor($0.image) }
+        let brightnesses = averages.map { brightness(of: $0) }
+
         // Analyze individual metrics
-        let exposureMetric = analyzeExposureConsistency(images: images)
-        let whiteBalanceMetric = analyzeWhiteBalanceConsistency(images: images)
+        let exposureMetric = analyzeExposureConsistency(brightnesses: brightnesses)
+        let whiteBalanceMetric = analyzeWhiteBalanceConsistency(averages: averages)
         let colorMetric = analyzeColorConsistency(images: images)
         let sharpnessMetric = analyzeSharpnessConsistency(images: images)
         let compositionMetric = analyzeCompositionConsistency(images: images)
@@ -43,7 +47,7 @@ actor BatchAnalyzer {
         let overallConsistency = calculateOverallConsistency(metrics: metrics)
 
         // Identify outliers
-        let outliers = identifyOutliers(images: images, metrics: metrics)
+        let outliers = identifyOutliers(images: images, brightnesses: brightnesses)
 
         // Generate recommendations
         let recommendations = generateRecommendations(metrics: metrics, outliers: outliers, images: images)
@@ -60,14 +64,7 @@ actor BatchAnalyzer {
 
     // MARK: - Exposure Consistency
 
-    private func analyzeExposureConsistency(images: [(image: CIImage, photoID: UUID)]) -> ConsistencyReport.MetricScore {
-        var brightnesses: [Double] = []
-
-        for item in images {
-            let brightness = calculateAverageBrightness(item.image)
-            brightnesses.append(brightness)
-        }
-
+    private func analyzeExposureConsistency(brightnesses: [Double]) -> ConsistencyReport.MetricScore {
         let mean = brightnesses.reduce(0, +) / Double(brightnesses.count)
         let variance = brightnesses.map { pow($0 - mean, 2) }.reduce(0, +) / Double(brightnesses.count)
         let stdDev = sqrt(variance)
@@ -93,13 +90,19 @@ actor BatchAnalyzer {
         return ConsistencyReport.MetricScore(score: score, variance: variance, notes: notes)
     }
 
-    private func calculateAverageBrightness(_ image: CIImage) -> Double {
-        guard let filter = CIFilter(name: "CIAreaAverage") else { return 0.5 }
+    private func brightness(of average: (r: Double, g: Double, b: Double)?) -> Double {
+        guard let average else { return 0.5 }
+        return 0.2126 * average.r + 0.7152 * average.g + 0.0722 * average.b
+    }
+
+    /// Mean RGB of the whole frame from a single CIAreaAverage pass
+    private func averageColor(_ image: CIImage) -> (r: Double, g: Double, b: Double)? {
+        guard let filter = CIFilter(name: "CIAreaAverage") else { return nil }
 
         filter.setValue(image, forKey: kCIInputImageKey)
         filter.setValue(CIVector(cgRect: image.extent), forKey: kCIInputExtentKey)
 
-        guard let outputImage = filter.outputImage else { return 0.5 }
+        guard let outputImage = filter.outputImage else { return nil }
 
         var bitmap = [Float](repeating: 0, count: 4)
         context.render(outputImage,
@@ -109,18 +112,13 @@ actor BatchAnalyzer {
                        format: .RGBAf,
                        colorSpace: nil)
 
-        return Double(0.2126 * bitmap[0] + 0.7152 * bitmap[1] + 0.0722 * bitmap[2])
+        return (r: Double(bitmap[0]), g: Double(bitmap[1]), b: Double(bitmap[2]))
     }
 
     // MARK: - White Balance Consistency
 
-    private func analyzeWhiteBalanceConsistency(images: [(image: CIImage, photoID: UUID)]) -> ConsistencyReport.MetricScore {
-        var colorCasts: [(r: Double, g: Double, b: Double)] = []
-
-        for item in images {
-            let cast = calculateColorCast(item.image)
-            colorCasts.append(cast)
-        }
+    private func analyzeWhiteBalanceConsistency(averages: [(r: Double, g: Double, b: Double)?]) -> ConsistencyReport.MetricScore {
+        let colorCasts = averages.map { $0 ?? (r: 0, g: 0, b: 0) }
 
         // Calculate variance in color channels
         let rValues = colorCasts.map { $0.r }
@@ -152,24 +150,6 @@ actor BatchAnalyzer {
         return ConsistencyReport.MetricScore(score: score, variance: avgVariance, notes: notes)
     }
 
-    private func calculateColorCast(_ image: CIImage) -> (r: Double, g: Double, b: Double) {
-        guard let filter = CIFilter(name: "CIAreaAverage") else { return (0, 0, 0) }
-
-        filter.setValue(image, forKey: kCIInputImageKey)
-        filter.setValue(CIVector(cgRect: image.extent), forKey: kCIInputExtentKey)
-
-        guard let outputImage = filter.outputImage else { return (0, 0, 0) }
-
-        var bitmap = [UInt8](repeating: 0, count: 4)
-        context.render(outputImage, toBitmap: &bitmap, rowBytes: 4, bounds: CGRect(x: 0, y: 0, width: 1, height: 1), format: .RGBA8, colorSpace: nil)
-
-        return (
-            r: Double(bitmap[0]) / 255.0,
-            g: Double(bitmap[1]) / 255.0,
-            b: Double(bitmap[2]) / 255.0
-        )
-    }
-
     // MARK: - Color Consistency
 
     private func analyzeColorConsistency(images: [(image: CIImage, photoID: UUID)]) -> ConsistencyReport.MetricScore {
@@ -412,12 +392,11 @@ actor BatchAnalyzer {
 
     private func identifyOutliers(
         images: [(image: CIImage, photoID: UUID)],
-        metrics: ConsistencyReport.ConsistencyMetrics
+        brightnesses: [Double]
     ) -> [ConsistencyReport.OutlierPhoto] {
         var outliers: [ConsistencyReport.OutlierPhoto] = []
 
         // Check exposure outliers
-        let brightnesses = images.map { calculateAverageBrightness($0.image) }
         let meanBrightness = brightnesses.reduce(0, +) / Double(brightnesses.count)
         let stdDev = sqrt(calculateVariance(brightnesses))
 
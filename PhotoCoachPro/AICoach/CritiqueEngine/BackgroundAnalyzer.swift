@@ -17,13 +17,15 @@ actor BackgroundAnalyzer {
         self.context = context
     }
 
-    func analyze(_ image: CIImage) async throws -> CritiqueResult.CategoryScore {
+    /// - Parameter rendered: `image` already rendered to a CGImage for Vision, when
+    ///   the caller has one; otherwise it is rendered here.
+    func analyze(_ image: CIImage, rendered: CGImage? = nil) async throws -> CritiqueResult.CategoryScore {
         var score: Double = 0.0
         var issues: [String] = []
         var strengths: [String] = []
 
         // Analyze subject separation
-        let separationScore = try await analyzeSubjectSeparation(image)
+        let separationScore = try await analyzeSubjectSeparation(image, rendered: rendered)
         score += separationScore * 0.5
 
         if separationScore > 0.7 {
@@ -56,8 +58,8 @@ actor BackgroundAnalyzer {
 
     // MARK: - Subject Separation
 
-    private func analyzeSubjectSeparation(_ image: CIImage) async throws -> Double {
-        guard let cgImage = context.createCGImage(image, from: image.extent) else {
+    private func analyzeSubjectSeparation(_ image: CIImage, rendered: CGImage?) async throws -> Double {
+        guard let cgImage = rendered ?? context.createCGImage(image, from: image.extent) else {
             return 0.5
         }
 
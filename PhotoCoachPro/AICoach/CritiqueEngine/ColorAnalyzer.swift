@@ -21,8 +21,11 @@ actor ColorAnalyzer {
         var issues: [String] = []
         var strengths: [String] = []
 
+        // One 64×64 render feeds the saturation and harmony checks
+        let sample = sampleColors(image)
+
         // Analyze saturation
-        let saturationScore = analyzeSaturation(image)
+        let saturationScore = analyzeSaturation(sample)
         score += saturationScore * 0.3
 
         if saturationScore < 0.4 {
@@ -42,7 +45,7 @@ actor ColorAnalyzer {
         }
 
         // Analyze color harmony
-        let harmonyScore = analyzeColorHarmony(image)
+        let harmonyScore = analyzeColorHarmony(sample)
         score += harmonyScore * 0.3
 
         if harmonyScore > 0.7 {
@@ -61,39 +64,21 @@ actor ColorAnalyzer {
         )
     }
 
-    // MARK: - Saturation Analysis
-
-    private func analyzeSaturation(_ image: CIImage) -> Double {
-        return smoothSaturationScore(calculateAverageSaturation(image))
-    }
+    // MARK: - Color Sampling
 
-    /// Smooth bell curve: ideal zone 0.35–0.55, tapers toward both desaturated and
-    /// oversaturated extremes without cliff edges.
-    private func smoothSaturationScore(_ s: Double) -> Double {
-        switch s {
-        case ..<0.10:
-            return 0.20 + (s / 0.10) * 0.25                          // 0.20 → 0.45
-        case 0.10..<0.30:
-            return 0.45 + ((s - 0.10) / 0.20) * 0.45                 // 0.45 → 0.90
-        case 0.30..<0.35:
-            return 0.90 + ((s - 0.30) / 0.05) * 0.10                 // 0.90 → 1.00
-        case 0.35..<0.55:
-            return 1.00                                                // Ideal zone
-        case 0.55..<0.70:
-            return 1.00 - ((s - 0.55) / 0.15) * 0.20                 // 1.00 → 0.80
-        case 0.70..<0.85:
-            return 0.80 - ((s - 0.70) / 0.15) * 0.30                 // 0.80 → 0.50
-        default:
-            return max(0.25, 0.50 - (s - 0.85) * 1.67)               // → 0.25 floor
-        }
+    /// Per-pixel statistics gathered in a single pass over the 64×64 sample
+    private struct ColorSample {
+        let meanSaturation: Double
+        let hueBins: [Double]               // 36 bins × 10° = full 360° hue wheel
+        let coloredPixels: Int
     }
 
-    /// Computes mean HSV saturation across all pixels by rendering to a 64×64 bitmap
-    /// and averaging per-pixel S = (max - min) / max values.
-    private func calculateAverageSaturation(_ image: CIImage) -> Double {
+    /// Renders the image once to a 64×64 bitmap and walks it once, accumulating
+    /// mean HSV saturation S = (max - min) / max and the hue histogram.
+    private func sampleColors(_ image: CIImage) -> ColorSample? {
         let sampleSize = 64
         let ext = image.extent
-        guard ext.width > 0, ext.height > 0 else { return 0.5 }
+        guard ext.width > 0, ext.height > 0 else { return nil }
 
         let toOrigin = CGAffineTransform(translationX: -ext.minX, y: -ext.minY)
         let scale = CGAffineTransform(
@@ -113,21 +98,77 @@ actor ColorAnalyzer {
         )
 
         var totalSaturation: Double = 0
+        var hueBins = [Double](repeating: 0, count: 36)
+        var coloredPixels = 0
+
         let pixelCount = sampleSize * sampleSize
         for i in 0..<pixelCount {
             let r = Double(pixelData[i * 4])     / 255.0
             let g = Double(pixelData[i * 4 + 1]) / 255.0
             let b = Double(pixelData[i * 4 + 2]) / 255.0
+
             let maxC = max(r, g, b)
             let minC = min(r, g, b)
-            totalSaturation += maxC > 0 ? (maxC - minC) / maxC : 0
+            let delta = maxC - minC
+            totalSaturation += maxC > 0 ? delta / maxC : 0
+
+            // Skip near-gray pixels — they don't contribute meaningful hue information
+            guard delta > 0.15 * maxC, maxC > 0 else { continue }
+            coloredPixels += 1
+
+            // HSV hue in degrees [0, 360)
+            var hue: Double
+            if maxC == r {
+                hue = 60.0 * ((g - b) / delta)
+                if hue < 0 { hue += 360 }
+            } else if maxC == g {
+                hue = 60.0 * ((b - r) / delta) + 120
+            } else {
+                hue = 60.0 * ((r - g) / delta) + 240
+            }
+
+            hueBins[Int(hue / 10.0) % 36] += 1
         }
 
-        return totalSaturation / Double(pixelCount)
+        let count = Double(pixelCount)
+        return ColorSample(
+            meanSaturation: totalSaturation / count,
+            hueBins: hueBins,
+            coloredPixels: coloredPixels
+        )
+    }
+
+    // MARK: - Saturation Analysis
+
+    private func analyzeSaturation(_ sample: ColorSample?) -> Double {
+        return smoothSaturationScore(sample?.meanSaturation ?? 0.5)
+    }
+
+    /// Smooth bell curve: ideal zone 0.35–0.55, tapers toward both desaturated and
+    /// oversaturated extremes without cliff edges.
+    private func smoothSaturationScore(_ s: Double) -> Double {
+        switch s {
+        case ..<0.10:
+            return 0.20 + (s / 0.10) * 0.25                          // 0.20 → 0.45
+        case 0.10..<0.30:
+            return 0.45 + ((s - 0.10) / 0.20) * 0.45                 // 0.45 → 0.90
+        case 0.30..<0.35:
+            return 0.90 + ((s - 0.30) / 0.05) * 0.10                 // 0.90 → 1.00
+        case 0.35..<0.55:
+            return 1.00                                                // Ideal zone
+        case 0.55..<0.70:
+            return 1.00 - ((s - 0.55) / 0.15) * 0.20                 // 1.00 → 0.80
+        case 0.70..<0.85:
+            return 0.80 - ((s - 0.70) / 0.15) * 0.30                 // 0.80 → 0.50
+        default:
+            return max(0.25, 0.50 - (s - 0.85) * 1.67)               // → 0.25 floor
+        }
     }
 
     // MARK: - White Balance Analysis
 
+    /// White balance reads a float full-extent CIAreaAverage rather than the
+    /// 8-bit sample, so subtle casts are not lost to quantization.
     private func analyzeWhiteBalance(_ image: CIImage) -> Double {
         // Analyze color cast by checking RGB balance
         guard let areaAverage = CIFilter(name: "CIAreaAverage") else { return 0.5 }
@@ -174,60 +215,13 @@ actor ColorAnalyzer {
 
     // MARK: - Color Harmony
 
-    /// Analyzes color harmony by building a 36-bin hue histogram from per-pixel HSV conversion,
-    /// clustering dominant hues, and scoring the result against known harmonic relationships
+    /// Analyzes color harmony from the sample's 36-bin hue histogram, clustering
+    /// dominant hues and scoring the result against known harmonic relationships
     /// (monochromatic, analogous, complementary, triadic).
-    private func analyzeColorHarmony(_ image: CIImage) -> Double {
-        let sampleSize = 64
-        let ext = image.extent
-        guard ext.width > 0, ext.height > 0 else { return 0.7 }
-
-        let toOrigin = CGAffineTransform(translationX: -ext.minX, y: -ext.minY)
-        let scale = CGAffineTransform(
-            scaleX: CGFloat(sampleSize) / ext.width,
-            y: CGFloat(sampleSize) / ext.height
-        )
-        let sampled = image.transformed(by: toOrigin.concatenating(scale))
-
-        var pixelData = [UInt8](repeating: 0, count: sampleSize * sampleSize * 4)
-        context.render(
-            sampled,
-            toBitmap: &pixelData,
-            rowBytes: sampleSize * 4,
-            bounds: CGRect(x: 0, y: 0, width: sampleSize, height: sampleSize),
-            format: .RGBA8,
-            colorSpace: nil
-        )
-
-        // 36 bins × 10° = full 360° hue wheel
-        var hueBins = [Double](repeating: 0, count: 36)
-        var coloredPixels = 0
-
-        for i in 0..<(sampleSize * sampleSize) {
-            let r = Double(pixelData[i * 4])     / 255.0
-            let g = Double(pixelData[i * 4 + 1]) / 255.0
-            let b = Double(pixelData[i * 4 + 2]) / 255.0
-            let maxC = max(r, g, b)
-            let minC = min(r, g, b)
-            let delta = maxC - minC
-
-            // Skip near-gray pixels — they don't contribute meaningful hue information
-            guard delta > 0.15 * maxC, maxC > 0 else { continue }
-            coloredPixels += 1
-
-            // HSV hue in degrees [0, 360)
-            var hue: Double
-            if maxC == r {
-                hue = 60.0 * ((g - b) / delta)
-                if hue < 0 { hue += 360 }
-            } else if maxC == g {
-                hue = 60.0 * ((b - r) / delta) + 120
-            } else {
-                hue = 60.0 * ((r - g) / delta) + 240
-            }
-
-            hueBins[Int(hue / 10.0) % 36] += 1
-        }
+    private func analyzeColorHarmony(_ sample: ColorSample?) -> Double {
+        guard let sample else { return 0.7 }
+        let hueBins = sample.hueBins
+        let coloredPixels = sample.coloredPixels
 
         // Too few colorful pixels to judge harmony (monochrome/B&W image)
         guard coloredPixels > 20 else { return 0.75 }
@@ -19,13 +19,15 @@ actor CompositionAnalyzer {
 
     // MARK: - Analysis
 
-    func analyze(_ image: CIImage) async throws -> CritiqueResult.CategoryScore {
+    /// - Parameter rendered: `image` already rendered to a CGImage for Vision, when
+    ///   the caller has one; otherwise it is rendered here.
+    func analyze(_ image: CIImage, rendered: CGImage? = nil) async throws -> CritiqueResult.CategoryScore {
         var score: Double = 0.0
         var issues: [String] = []
         var strengths: [String] = []
 
         // Analyze saliency (where the eye is drawn)
-        let saliencyScore = try await analyzeSaliency(image)
+        let saliencyScore = try await analyzeSaliency(image, rendered: rendered)
         score += saliencyScore * 0.4
 
         if saliencyScore > 0.7 {
@@ -45,7 +47,7 @@ actor CompositionAnalyzer {
         }
 
         // Analyze rule of thirds alignment
-        let thirdsScore = try await analyzeRuleOfThirds(image)
+        let thirdsScore = try await analyzeRuleOfThirds(image, rendered: rendered)
         score += thirdsScore * 0.3
 
         if thirdsScore > 0.7 {
@@ -69,8 +71,8 @@ actor CompositionAnalyzer {
 
     // MARK: - Saliency Analysis
 
-    private func analyzeSaliency(_ image: CIImage) async throws -> Double {
-        guard let cgImage = context.createCGImage(image, from: image.extent) else {
+    private func analyzeSaliency(_ image: CIImage, rendered: CGImage?) async throws -> Double {
+        guard let cgImage = rendered ?? context.createCGImage(image, from: image.extent) else {
             return 0.5
         }
 
@@ -202,9 +204,9 @@ actor CompositionAnalyzer {
 
     // MARK: - Rule of Thirds
 
-    private func analyzeRuleOfThirds(_ image: CIImage) async throws -> Double {
+    private func analyzeRuleOfThirds(_ image: CIImage, rendered: CGImage?) async throws -> Double {
         // Detect if subject is on rule of thirds power points
-        guard let cgImage = context.createCGImage(image, from: image.extent) else {
+        guard let cgImage = rendered ?? context.createCGImage(image, from: image.extent) else {
             return 0.5
         }
 
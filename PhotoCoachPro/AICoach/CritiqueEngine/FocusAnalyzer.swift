@@ -17,14 +17,16 @@ actor FocusAnalyzer {
         self.context = context
     }
 
-    func analyze(_ image: CIImage) async throws -> CritiqueResult.CategoryScore {
+    /// - Parameter rendered: `image` already rendered to a CGImage for Vision, when
+    ///   the caller has one; otherwise it is rendered here.
+    func analyze(_ image: CIImage, rendered: CGImage? = nil) async throws -> CritiqueResult.CategoryScore {
         var score: Double = 0.0
         var issues: [String] = []
         var strengths: [String] = []
 
         // Crop to the primary salient region so sharpness is measured on the
         // subject, not on a blurred background or empty corners.
-        let subjectImage = saliencyBoundedRegion(image)
+        let subjectImage = saliencyBoundedRegion(image, rendered: rendered)
 
         // Analyze overall sharpness
         let sharpnessScore = analyzeSharpness(subjectImage)
@@ -62,8 +64,8 @@ actor FocusAnalyzer {
 
     /// Returns the image cropped to its primary salient region.
     /// Falls back to the full image when saliency detection fails or finds nothing.
-    private func saliencyBoundedRegion(_ image: CIImage) -> CIImage {
-        guard let cgImage = context.createCGImage(image, from: image.extent) else {
+    private func saliencyBoundedRegion(_ image: CIImage, rendered: CGImage?) -> CIImage {
+        guard let cgImage = rendered ?? context.createCGImage(image, from: image.extent) else {
             return image
         }
 
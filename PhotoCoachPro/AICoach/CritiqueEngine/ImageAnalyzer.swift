@@ -17,9 +17,11 @@ actor ImageAnalyzer {
     private let colorAnalyzer: ColorAnalyzer
     private let backgroundAnalyzer: BackgroundAnalyzer
     private let storyAnalyzer: StoryAnalyzer
+    private let context: CIContext
 
     init() {
         let sharedContext = CIContext(options: [.workingColorSpace: CGColorSpace(name: CGColorSpace.displayP3)!])
+        self.context = sharedContext
         self.compositionAnalyzer = CompositionAnalyzer(context: sharedContext)
         self.lightAnalyzer = LightAnalyzer(context: sharedContext)
         self.focusAnalyzer = FocusAnalyzer(context: sharedContext)
@@ -32,13 +34,17 @@ actor ImageAnalyzer {
 
     /// Analyze photo and generate complete critique
     func analyze(_ image: CIImage, photoID: UUID) async throws -> CritiqueResult {
+        // Composition, focus, background and story each hand Vision a CGImage;
+        // render it once here instead of once per analyzer
+        let rendered = renderForVision(image)
+
         // Run all analyzers in parallel
-        async let compositionScore = compositionAnalyzer.analyze(image)
+        async let compositionScore = compositionAnalyzer.analyze(image, rendered: rendered)
         async let lightScore = lightAnalyzer.analyze(image)
-        async let focusScore = focusAnalyzer.analyze(image)
+        async let focusScore = focusAnalyzer.analyze(image, rendered: rendered)
         async let colorScore = colorAnalyzer.analyze(image)
-        async let backgroundScore = backgroundAnalyzer.analyze(image)
-        async let storyScore = storyAnalyzer.analyze(image)
+        async let backgroundScore = backgroundAnalyzer.analyze(image, rendered: rendered)
+        async let storyScore = storyAnalyzer.analyze(image, rendered: rendered)
 
         // Collect results
         let categories = CritiqueResult.CategoryBreakdown(
@@ -76,6 +82,17 @@ actor ImageAnalyzer {
         )
     }
 
+    /// The same 8-bit render each Vision-based analyzer used to make for itself.
+    /// Only Vision reads it: Core Image passes, and the light and color analyzers,
+    /// keep working on the original image at full precision and gamut.
+    private func renderForVision(_ image: CIImage) -> CGImage? {
+        if let cgImage = image.cgImage {
+            return cgImage
+        }
+        guard !image.extent.isInfinite else { return nil }
+        return context.createCGImage(image, from: image.extent)
+    }
+
     // MARK: - Scoring
 
     private func calculateOverallScore(categories: CritiqueResult.CategoryBreakdown) -> Double {
@@ -291,15 +308,14 @@ actor ImageAnalyzer {
 
 // MARK: - Batch Analysis
 extension ImageAnalyzer {
-    /// Analyze multiple photos and return critiques
-    func analyzeBatch(_ images: [(image: CIImage, photoID: UUID)]) async throws -> [CritiqueResult] {
-        var results: [CritiqueResult] = []
-
-        for item in images {
-            let critique = try await analyze(item.image, photoID: item.photoID)
-            results.append(critique)
+    /// Analyze multiple photos and return critiques in input order.
+    /// Up to `maxConcurrent` photos are in flight at once, so one photo's slow
+    /// analyzer (e.g. Vision saliency) overlaps with the others' work. Each photo
+    /// in flight holds a full-resolution bitmap (about 190 MB at 48 MP), so keep
+    /// the limit low on memory-constrained devices.
+    func analyzeBatch(_ images: [(image: CIImage, photoID: UUID)], maxConcurrent: Int = 2) async throws -> [CritiqueResult] {
+        try await images.concurrentMap(maxConcurrent: maxConcurrent) { item in
+            try await self.analyze(item.image, photoID: item.photoID)
         }
-
-        return results
     }
 }
@@ -9,6 +9,9 @@
 import Foundation
 import CoreImage
 import CoreGraphics
+import ImageIO
+import Accelerate
+import CryptoKit
 
 // MARK: - Result Models
 
@@ -51,28 +54,135 @@ struct QuickMetricsResult {
     let overallScore: CGFloat           // Weighted average
 }
 
+/// RGBA8 pixels rendered once and shared by the quick metric passes
+struct AnalysisBitmap {
+    let pixels: [UInt8]                 // Tightly packed RGBA, 4 bytes per pixel
+    let width: Int
+    let height: Int
+
+    var pixelCount: Int { width * height }
+
+    /// Rec.709 luma plane derived from the RGBA pixels.
+    /// Integer weights 54/183/19 sum to 256, so the result stays in 0-255.
+    /// vImage runs the weighted sum as a SIMD matrix multiply over the interleaved buffer.
+    func lumaPlane() -> [UInt8] {
+        var luma = [UInt8](repeating: 0, count: pixelCount)
+        // Matrix rows follow memory channel order: R, G, B, A
+        let weights: [Int16] = [54, 183, 19, 0]
+        pixels.withUnsafeBytes { srcRaw in
+            luma.withUnsafeMutableBytes { dstRaw in
+                // vImage only reads the source, so the const buffer is safe to hand over
+                var srcBuffer = vImage_Buffer(
+                    data: UnsafeMutableRawPointer(mutating: srcRaw.baseAddress),
+                    height: vImagePixelCount(height),
+                    width: vImagePixelCount(width),
+                    rowBytes: width * 4)
+                var dstBuffer = vImage_Buffer(
+                    data: dstRaw.baseAddress,
+                    height: vImagePixelCount(height),
+                    width: vImagePixelCount(width),
+                    rowBytes: width)
+                _ = vImageMatrixMultiply_ARGB8888ToPlanar8(&srcBuffer, &dstBuffer, weights, 256,
+                                                           nil, 0, vImage_Flags(kvImageNoFlags))
+            }
+        }
+        return luma
+    }
+}
+
 // MARK: - Quick Metrics Analyzer
 
 /// Lightweight image analysis using Core Image (no AI/ML)
 /// Provides fast, explainable metrics for color, sharpness, and exposure
 actor QuickMetricsAnalyzer {
     private let context: CIContext
-
-    init(context: CIContext = CIContext(options: [.workingColorSpace: CGColorSpace(name: CGColorSpace.displayP3)!])) {
+    private var resultCache: LRUCache<ResultKey, QuickMetricsResult>
+
+    /// Color space of every analysis bitmap. Core Image renders and ImageIO
+    /// decodes both land in sRGB, so a photo scores the same whichever path loads it.
+    private static let bitmapColorSpace = CGColorSpace(name: CGColorSpace.sRGB)!
+
+    /// Longest side, in pixels, of the bitmap the quick metrics run on
+    private static let analysisMaxDimension: CGFloat = 1400
+
+    /// ImageIO options, built once instead of on every decode.
+    /// Sources never cache decoded pixels; every image is decoded exactly once.
+    private static let sourceOptions = [kCGImageSourceShouldCache: false] as CFDictionary
+
+    /// Thumbnail decode lets ImageIO shrink on load: for JPEG it decodes at a
+    /// reduced DCT scale instead of inflating the full frame.
+    private static let decodeOptions = [
+        kCGImageSourceShouldCache: false,
+        kCGImageSourceCreateThumbnailFromImageAlways: true,   // ignore small embedded previews
+        kCGImageSourceCreateThumbnailWithTransform: false,
+        kCGImageSourceThumbnailMaxPixelSize: Int(analysisMaxDimension)
+    ] as CFDictionary
+
+    init(
+        context: CIContext = CIContext(options: [.workingColorSpace: CGColorSpace(name: CGColorSpace.displayP3)!]),
+        maxCachedResults: Int = 64
+    ) {
         self.context = context
+        self.resultCache = LRUCache(capacity: maxCachedResults)
     }
 
     // MARK: - Public Interface
 
-    /// Analyze an image with all quick metrics
+    /// Analyze an image with all quick metrics.
+    /// Core Image decodes the source at full size before scaling it down, so for
+    /// files prefer `analyze(contentsOf:)`, whose decode shrinks on load.
     func analyze(_ image: CIImage) async throws -> QuickMetricsResult {
         // Resize image for consistent analysis speed
-        let resized = resizeForAnalysis(image, maxDimension: 1400)
+        let resized = resizeForAnalysis(image, maxDimension: Self.analysisMaxDimension)
+
+        // Render (and therefore decode) once; every metric reads the same pixels
+        return try await analyze(renderBitmap(resized))
+    }
+
+    /// Analyze an image file without building a CIImage first.
+    /// Results are cached per file version (path, modification date and size),
+    /// so re-analyzing an unchanged file skips decode and analysis.
+    nonisolated func analyze(contentsOf url: URL) async throws -> QuickMetricsResult {
+        let key = FileVersionKey(url: url).map(ResultKey.file)
+        if let key, let cached = await cachedResult(for: key) {
+            return cached
+        }
+
+        let result = try await analyze(decodeBitmap { CGImageSourceCreateWithURL(url as CFURL, Self.sourceOptions) })
+        if let key {
+            await cacheResult(result, for: key)
+        }
+        return result
+    }
+
+    /// Analyze encoded image bytes (JPEG, HEIC, PNG, ...) straight from memory.
+    /// Results are cached by content digest, so re-submitting the same bytes
+    /// skips decode and analysis.
+    nonisolated func analyze(imageData: Data) async throws -> QuickMetricsResult {
+        let key = ResultKey.content(SHA256.hash(data: imageData))
+        if let cached = await cachedResult(for: key) {
+            return cached
+        }
+
+        let result = try await analyze(decodeBitmap { CGImageSourceCreateWithData(imageData as CFData, Self.sourceOptions) })
+        await cacheResult(result, for: key)
+        return result
+    }
+
+    /// Analyze pixels that have already been rendered for analysis.
+    ///
+    /// The pixel passes only read their arguments and static constants, so they
+    /// are nonisolated: the three metrics really run side by side on the
+    /// cooperative pool instead of queueing on the actor, and a long decode never
+    /// holds up callers waiting on the CIImage entry points.
+    nonisolated func analyze(_ bitmap: AnalysisBitmap) async throws -> QuickMetricsResult {
+        // Sharpness and exposure both work on luma, so derive the plane once
+        let luma = bitmap.lumaPlane()
 
         // Run all analyses in parallel
-        async let colorTask = analyzeColor(resized)
-        async let sharpnessTask = analyzeSharpness(resized)
-        async let exposureTask = analyzeExposure(resized)
+        async let colorTask = analyzeColor(bitmap)
+        async let sharpnessTask = analyzeSharpness(luma: luma, width: bitmap.width, height: bitmap.height)
+        async let exposureTask = analyzeExposure(luma: luma, width: bitmap.width, height: bitmap.height)
 
         let color = try await colorTask
         let sharpness = try await sharpnessTask
@@ -89,37 +199,76 @@ actor QuickMetricsAnalyzer {
         )
     }
 
+    // MARK: - Result Cache
+
+    private func cachedResult(for key: ResultKey) -> QuickMetricsResult? {
+        resultCache.value(for: key)
+    }
+
+    private func cacheResult(_ result: QuickMetricsResult, for key: ResultKey) {
+        resultCache.setValue(result, for: key)
+    }
+
+    func cachedResultCount() -> Int {
+        resultCache.count
+    }
+
+    /// The input a cached result was computed from
+    private enum ResultKey: Hashable {
+        /// Digest of encoded image bytes
+        case content(SHA256Digest)
+        /// One version of a file on disk
+        case file(FileVersionKey)
+    }
+
     // MARK: - Color Analysis
 
     func analyzeColor(_ image: CIImage) async throws -> QuickColorMetrics {
-        let extent = image.extent
+        try await analyzeColor(renderBitmap(image))
+    }
 
-        // Get average RGB using CIAreaAverage
-        guard let avgFilter = CIFilter(name: "CIAreaAverage", parameters: [
-            kCIInputImageKey: image,
-            kCIInputExtentKey: CIVector(cgRect: extent)
-        ]), let avgOutput = avgFilter.outputImage else {
-            throw AnalysisError.filterFailed
-        }
+    nonisolated func analyzeColor(_ bitmap: AnalysisBitmap) async throws -> QuickColorMetrics {
+        let pixels = bitmap.pixels
+        let pixelCount = bitmap.pixelCount
+
+        // Single pass over the pixel buffer: channel sums for mean RGB plus
+        // per-pixel HSV saturation S = (max - min) / max. H and V are never
+        // needed, so no HSV image is built. S is computed in integer math as
+        // an 8-bit value, the same quantisation as an HSV S band.
+        var sumR = 0, sumG = 0, sumB = 0
+        var satHist = [Int](repeating: 0, count: 256)
 
-        // Read the single pixel output — Float render for sub-integer precision, scaled to 0–255 range
-        var bitmap = [Float](repeating: 0, count: 4)
-        context.render(avgOutput, toBitmap: &bitmap, rowBytes: 4 * MemoryLayout<Float>.size, bounds: CGRect(x: 0, y: 0, width: 1, height: 1), format: .RGBAf, colorSpace: nil)
+        for i in 0..<pixelCount {
+            let r = Int(pixels[i * 4])
+            let g = Int(pixels[i * 4 + 1])
+            let b = Int(pixels[i * 4 + 2])
+            sumR += r
+            sumG += g
+            sumB += b
 
-        let meanR = CGFloat(bitmap[0]) * 255.0
-        let meanG = CGFloat(bitmap[1]) * 255.0
-        let meanB = CGFloat(bitmap[2]) * 255.0
+            let maxC = max(r, g, b)
+            let minC = min(r, g, b)
+            satHist[maxC > 0 ? (maxC - minC) * 255 / maxC : 0] += 1
+        }
+
+        let meanR = CGFloat(sumR) / CGFloat(pixelCount)
+        let meanG = CGFloat(sumG) / CGFloat(pixelCount)
+        let meanB = CGFloat(sumB) / CGFloat(pixelCount)
         let meanRGB = [meanR, meanG, meanB]
 
         // Calculate color cast indicators
         let warmth = meanR - meanB  // Positive = warm, negative = cool
         let greenMagenta = meanG - ((meanR + meanB) / 2.0)  // Positive = green, negative = magenta
 
-        // Calculate saturation from RGB (simple approximation)
-        let saturationMean = calculateSaturation(r: meanR, g: meanG, b: meanB)
+        // Mean of per-pixel saturation (matches the Python backend's HSV S-band mean)
+        var saturationSum = 0
+        for (level, count) in satHist.enumerated() {
+            saturationSum += level * count
+        }
+        let saturationMean = CGFloat(saturationSum) / (255.0 * CGFloat(pixelCount))
 
-        // Compute saturation P95 from a 64×64 per-pixel HSV saturation histogram
-        let saturationP95 = calculateSaturationPercentile(image, percentile: 0.95)
+        // 95th percentile saturation from the same histogram
+        let saturationP95 = CGFloat(percentileBin(cdf: cumulativeCounts(satHist), percentile: 0.95)) / 255.0
 
         // Generate notes
         var notes: [String] = []
@@ -170,7 +319,7 @@ actor QuickMetricsAnalyzer {
             score += 3.0
         }
 
-        score = clamp(score, min: 0.0, max: 100.0)
+        score = max(0, min(100, score))
 
         return QuickColorMetrics(
             meanRGB: meanRGB,
@@ -186,57 +335,46 @@ actor QuickMetricsAnalyzer {
     // MARK: - Sharpness Analysis
 
     func analyzeSharpness(_ image: CIImage) async throws -> QuickSharpnessMetrics {
-        // Convert to grayscale using Rec.709 perceptual weights
-        let grayscale = image.applyingFilter("CIColorMatrix", parameters: [
-            "inputRVector":    CIVector(x: 0.2126, y: 0.7152, z: 0.0722, w: 0),
-            "inputGVector":    CIVector(x: 0.2126, y: 0.7152, z: 0.0722, w: 0),
-            "inputBVector":    CIVector(x: 0.2126, y: 0.7152, z: 0.0722, w: 0),
-            "inputAVector":    CIVector(x: 0,      y: 0,      z: 0,      w: 1),
-            "inputBiasVector": CIVector(x: 0,      y: 0,      z: 0,      w: 0)
-        ])
-
         // Resize for consistent analysis
-        let resized = resizeForAnalysis(grayscale, maxDimension: 1600)
+        let resized = resizeForAnalysis(image, maxDimension: 1600)
+        return try await analyzeSharpness(renderBitmap(resized))
+    }
 
-        // Use edge detection filter (simpler than custom convolution)
-        guard let edges = CIFilter(name: "CIEdges", parameters: [
-            kCIInputImageKey: resized,
-            kCIInputIntensityKey: 1.0
-        ])?.outputImage else {
-            throw AnalysisError.filterFailed
-        }
+    nonisolated func analyzeSharpness(_ bitmap: AnalysisBitmap) async throws -> QuickSharpnessMetrics {
+        try await analyzeSharpness(luma: bitmap.lumaPlane(), width: bitmap.width, height: bitmap.height)
+    }
 
-        let convolution = edges
+    private nonisolated func analyzeSharpness(luma: [UInt8], width: Int, height: Int) async throws -> QuickSharpnessMetrics {
+        await sharpnessMetrics(variance: laplacianVariance(luma, width: width, height: height))
+    }
 
-        // Calculate variance of the Laplacian
-        let variance = try await calculateImageVariance(convolution)
+    private nonisolated func sharpnessMetrics(variance: CGFloat) -> QuickSharpnessMetrics {
         let stdDev = sqrt(variance)
 
         // Generate notes
         var notes: [String] = []
 
-        if variance < 60 {
+        if variance < 80 {
             notes.append("Image likely soft or slightly out of focus")
-        } else if variance < 180 {
+        } else if variance < 250 {
             notes.append("Sharpness looks decent for typical viewing sizes")
         } else {
             notes.append("Strong fine detail; image appears very sharp")
         }
 
         // Score calculation using exponential curve.
-        // k is calibrated to the CIEdges histogram variance range (0–thousands).
-        // The original k=180 was calibrated for Laplacian variance on float [0,1] images
-        // and saturated far too early for the larger values produced here.
-        let k: CGFloat = 2000.0
+        // k is calibrated to the variance of the signed 4-neighbour Laplacian on
+        // 0–255 luma (single digits for blurred frames, high hundreds for crisp detail).
+        let k: CGFloat = 300.0
         var score = 100.0 * (1.0 - exp(-variance / k))
 
         // Penalty for very low variance
-        if variance < 25 {
+        if variance < 30 {
             score = max(0.0, score - 20.0)
             notes.append("Very low edge energy detected (possible motion blur or heavy noise reduction)")
         }
 
-        score = clamp(score, min: 0.0, max: 100.0)
+        score = max(0, min(100, score))
 
         return QuickSharpnessMetrics(
             laplacianStdDev: stdDev,
@@ -249,32 +387,44 @@ actor QuickMetricsAnalyzer {
     // MARK: - Exposure Analysis
 
     func analyzeExposure(_ image: CIImage) async throws -> QuickExposureMetrics {
-        // Convert to grayscale for luminance analysis (Rec.709 perceptual weights)
-        let grayscale = image.applyingFilter("CIColorMatrix", parameters: [
-            "inputRVector":    CIVector(x: 0.2126, y: 0.7152, z: 0.0722, w: 0),
-            "inputGVector":    CIVector(x: 0.2126, y: 0.7152, z: 0.0722, w: 0),
-            "inputBVector":    CIVector(x: 0.2126, y: 0.7152, z: 0.0722, w: 0),
-            "inputAVector":    CIVector(x: 0,      y: 0,      z: 0,      w: 1),
-            "inputBiasVector": CIVector(x: 0,      y: 0,      z: 0,      w: 0)
-        ])
-
-        // Get histogram
-        let histogram = try await calculateHistogram(grayscale)
+        // Render at analysis size; no float histogram image is produced,
+        // and the counts are exact
+        let resized = resizeForAnalysis(image, maxDimension: Self.analysisMaxDimension)
+        return try await analyzeExposure(renderBitmap(resized))
+    }
+
+    nonisolated func analyzeExposure(_ bitmap: AnalysisBitmap) async throws -> QuickExposureMetrics {
+        try await analyzeExposure(luma: bitmap.lumaPlane(), width: bitmap.width, height: bitmap.height)
+    }
+
+    private nonisolated func analyzeExposure(luma: [UInt8], width: Int, height: Int) async throws -> QuickExposureMetrics {
+        // Exact per-pixel luma counts
+        exposureMetrics(histogram: lumaHistogram(luma, width: width, height: height))
+    }
+
+    private nonisolated func exposureMetrics(histogram: [Int]) -> QuickExposureMetrics {
+        // One walk over the bins yields the CDF, the pixel total and the luma sum
+        var cdf = [Int](repeating: 0, count: histogram.count)
+        var running = 0
+        var weightedSum = 0
+        for (level, count) in histogram.enumerated() {
+            running += count
+            weightedSum += level * count
+            cdf[level] = running
+        }
+        let total = CGFloat(max(1, running))
 
         // Calculate percentiles
-        let p05 = calculatePercentile(histogram: histogram, percentile: 0.05)
-        let p95 = calculatePercentile(histogram: histogram, percentile: 0.95)
-        let mean = calculateMean(histogram: histogram)
+        let p05 = CGFloat(percentileBin(cdf: cdf, percentile: 0.05))
+        let p95 = CGFloat(percentileBin(cdf: cdf, percentile: 0.95))
+        let mean = CGFloat(weightedSum) / total
 
         let dynamicRange = p95 - p05
 
         // Calculate clipping — single-bin check (pure black = bin 0, pure white = bin 255)
         // Using 3-bin windows over-reports clipping on images with many near-white/near-black pixels.
-        let total = histogram.reduce(0, +)
-        let shadowSum = histogram[0]
-        let highlightSum = histogram[255]
-        let clippedShadows = (CGFloat(shadowSum) / CGFloat(total)) * 100.0
-        let clippedHighlights = (CGFloat(highlightSum) / CGFloat(total)) * 100.0
+        let clippedShadows = (CGFloat(histogram[0]) / total) * 100.0
+        let clippedHighlights = (CGFloat(histogram[255]) / total) * 100.0
 
         // Generate notes
         var notes: [String] = []
@@ -327,7 +477,7 @@ actor QuickMetricsAnalyzer {
             score += 3.0
         }
 
-        score = clamp(score, min: 0.0, max: 100.0)
+        score = max(0, min(100, score))
 
         return QuickExposureMetrics(
             brightnessMean: mean,
@@ -353,189 +503,198 @@ actor QuickMetricsAnalyzer {
         return image.transformed(by: CGAffineTransform(scaleX: scale, y: scale))
     }
 
-    private func calculateSaturation(r: CGFloat, g: CGFloat, b: CGFloat) -> CGFloat {
-        let maxC = max(r, g, b)
-        let minC = min(r, g, b)
-
-        guard maxC > 0 else { return 0 }
-
-        return (maxC - minC) / maxC  // Already normalized 0-1; inputs are 0-255 but ratio is scale-independent
-    }
-
-    /// Renders the image at 64×64 and computes per-pixel HSV saturation,
-    /// then returns the requested percentile from the resulting histogram.
-    private func calculateSaturationPercentile(_ image: CIImage, percentile: CGFloat) -> CGFloat {
-        let sampleSize = 64
+    /// Renders the image into a tightly packed sRGB RGBA8 buffer covering its full extent.
+    private func renderBitmap(_ image: CIImage) throws -> AnalysisBitmap {
         let ext = image.extent
-        guard ext.width > 0, ext.height > 0 else { return 0 }
+        guard ext.width > 0, ext.height > 0, !ext.isInfinite else {
+            throw AnalysisError.invalidImage
+        }
 
-        // Translate to origin then scale to sampleSize×sampleSize
-        let toOrigin = CGAffineTransform(translationX: -ext.minX, y: -ext.minY)
-        let scale = CGAffineTransform(
-            scaleX: CGFloat(sampleSize) / ext.width,
-            y: CGFloat(sampleSize) / ext.height
-        )
-        let sampled = image.transformed(by: toOrigin.concatenating(scale))
+        let width = Int(ext.width.rounded(.down))
+        let height = Int(ext.height.rounded(.down))
+        guard width > 0, height > 0 else { throw AnalysisError.invalidImage }
+
+        let atOrigin = image.transformed(by: CGAffineTransform(translationX: -ext.minX, y: -ext.minY))
 
-        var pixelData = [UInt8](repeating: 0, count: sampleSize * sampleSize * 4)
+        var pixels = [UInt8](repeating: 0, count: width * height * 4)
         context.render(
-            sampled,
-            toBitmap: &pixelData,
-            rowBytes: sampleSize * 4,
-            bounds: CGRect(x: 0, y: 0, width: sampleSize, height: sampleSize),
+            atOrigin,
+            toBitmap: &pixels,
+            rowBytes: width * 4,
+            bounds: CGRect(x: 0, y: 0, width: width, height: height),
             format: .RGBA8,
-            colorSpace: nil
+            colorSpace: Self.bitmapColorSpace
         )
 
-        // Build per-pixel HSV saturation histogram (256 bins, 0–1 range)
-        var satHist = [Int](repeating: 0, count: 256)
-        for i in 0..<(sampleSize * sampleSize) {
-            let r = CGFloat(pixelData[i * 4])
-            let g = CGFloat(pixelData[i * 4 + 1])
-            let b = CGFloat(pixelData[i * 4 + 2])
-            let maxC = max(r, g, b)
-            let minC = min(r, g, b)
-            let sat: CGFloat = maxC > 0 ? (maxC - minC) / maxC : 0
-            let bin = min(255, Int(sat * 255))
-            satHist[bin] += 1
-        }
+        return AnalysisBitmap(pixels: pixels, width: width, height: height)
+    }
 
-        // Walk the histogram to find the requested percentile.
-        // max(1, ...) prevents target=0 at percentile=0.0, which would cause an
-        // immediate early return from bin 0 before any counts are accumulated.
-        let total = sampleSize * sampleSize
-        let target = max(1, Int(percentile * CGFloat(total)))
-        var running = 0
-        for (i, count) in satHist.enumerated() {
-            running += count
-            if running >= target {
-                return CGFloat(i) / 255.0
+    /// Creates an ImageIO source and decodes it inside an autorelease pool. The
+    /// pool bounds peak memory within a single large decode: the source, any file
+    /// it maps and ImageIO's autoreleased temporaries go as soon as the pixels are
+    /// copied out, rather than living on through the metric passes.
+    nonisolated func decodeBitmap(_ makeSource: () -> CGImageSource?) throws -> AnalysisBitmap {
+        try autoreleasepool { () throws -> AnalysisBitmap in
+            guard let source = makeSource() else {
+                throw AnalysisError.invalidImage
             }
+            return try decodeBitmap(source)
         }
-        return 1.0
     }
 
-    private func calculateImageVariance(_ image: CIImage) async throws -> CGFloat {
-        let extent = image.extent
-
-        // Build a 256-bin histogram of the edge-energy image
-        guard let histOutput = CIFilter(name: "CIAreaHistogram", parameters: [
-            kCIInputImageKey: image,
-            kCIInputExtentKey: CIVector(cgRect: extent),
-            "inputCount": 256,
-            "inputScale": 1.0
-        ])?.outputImage else {
-            throw AnalysisError.filterFailed
+    /// Decodes the first image in an ImageIO source and draws it into an RGBA8
+    /// buffer no larger than `analysisMaxDimension` on its longest side.
+    /// EXIF orientation is not applied; none of the quick metrics depend on it.
+    private nonisolated func decodeBitmap(_ source: CGImageSource) throws -> AnalysisBitmap {
+        guard let cgImage = CGImageSourceCreateThumbnailAtIndex(source, 0, Self.decodeOptions),
+              cgImage.width > 0, cgImage.height > 0 else {
+            throw AnalysisError.invalidImage
         }
 
-        var histData = [Float](repeating: 0, count: 256 * 4)
-        context.render(
-            histOutput,
-            toBitmap: &histData,
-            rowBytes: 256 * 4 * MemoryLayout<Float>.size,
-            bounds: CGRect(x: 0, y: 0, width: 256, height: 1),
-            format: .RGBAf,
-            colorSpace: nil
-        )
-
-        // Extract red channel counts (edge image is grayscale, all channels equal)
-        var counts = [Double](repeating: 0, count: 256)
-        var total: Double = 0
-        for i in 0..<256 {
-            counts[i] = Double(histData[i * 4])
-            total += counts[i]
+        let scale = min(1.0, Self.analysisMaxDimension / CGFloat(max(cgImage.width, cgImage.height)))
+        let width = max(1, Int((CGFloat(cgImage.width) * scale).rounded()))
+        let height = max(1, Int((CGFloat(cgImage.height) * scale).rounded()))
+
+        var pixels = [UInt8](repeating: 0, count: width * height * 4)
+        let drawn = pixels.withUnsafeMutableBytes { buffer -> Bool in
+            guard let bitmapContext = CGContext(
+                data: buffer.baseAddress,
+                width: width,
+                height: height,
+                bitsPerComponent: 8,
+                bytesPerRow: width * 4,
+                space: Self.bitmapColorSpace,
+                bitmapInfo: CGImageAlphaInfo.premultipliedLast.rawValue
+            ) else {
+                return false
+            }
+            // Bilinear is enough for mean/percentile statistics and the Laplacian;
+            // the default quality runs a wider resampling kernel when minifying.
+            bitmapContext.interpolationQuality = .low
+            bitmapContext.draw(cgImage, in: CGRect(x: 0, y: 0, width: width, height: height))
+            return true
         }
 
-        guard total > 0 else { return 0 }
+        guard drawn else { throw AnalysisError.invalidImage }
+        return AnalysisBitmap(pixels: pixels, width: width, height: height)
+    }
 
-        // Compute mean from histogram
-        var mean: Double = 0
-        for i in 0..<256 {
-            mean += Double(i) * counts[i]
-        }
-        mean /= total
+    /// Variance of the 4-neighbour Laplacian (kernel [0 -1 0; -1 4 -1; 0 -1 0]).
+    /// The stencil and the running sums are fused into one pass over the interior
+    /// pixels, so no intermediate filtered image is allocated. Dropping the corner
+    /// taps halves the reads per pixel while keeping the same edge-energy signal.
+    ///
+    /// Interior rows are split into bands that run as child tasks on the
+    /// cooperative pool; each band keeps its own integer sums, which are combined
+    /// at the end, so the result is identical to the serial loop.
+    private nonisolated func laplacianVariance(_ luma: [UInt8], width: Int, height: Int) async -> CGFloat {
+        guard width > 2, height > 2 else { return 0 }
+
+        let interiorRows = height - 2
+        let bandCount = min(interiorRows, ProcessInfo.processInfo.activeProcessorCount)
+        let rowsPerBand = (interiorRows + bandCount - 1) / bandCount
+
+        let (sum, sumSquares) = await withTaskGroup(of: (sum: Int, sumSquares: Int).self) { group in
+            for band in 0..<bandCount {
+                let firstRow = 1 + band * rowsPerBand
+                let lastRow = min(height - 1, firstRow + rowsPerBand)
+                guard firstRow < lastRow else { break }
+
+                group.addTask {
+                    Self.laplacianSums(luma, width: width, rows: firstRow..<lastRow)
+                }
+            }
 
-        // Compute variance: Σ count[i] * (i - mean)² / total
-        var variance: Double = 0
-        for i in 0..<256 {
-            let diff = Double(i) - mean
-            variance += counts[i] * diff * diff
+            var total = (sum: 0, sumSquares: 0)
+            for await band in group {
+                total.sum += band.sum
+                total.sumSquares += band.sumSquares
+            }
+            return total
         }
-        variance /= total
 
-        return CGFloat(variance)
+        let count = Double((width - 2) * interiorRows)
+        let mean = Double(sum) / count
+        return CGFloat(max(0, Double(sumSquares) / count - mean * mean))
     }
 
-    private func calculateHistogram(_ image: CIImage) async throws -> [Int] {
-        // Use CIAreaHistogram filter
-        let extent = image.extent
-
-        guard let histFilter = CIFilter(name: "CIAreaHistogram", parameters: [
-            kCIInputImageKey: image,
-            kCIInputExtentKey: CIVector(cgRect: extent),
-            "inputCount": 256,
-            "inputScale": 1.0
-        ])?.outputImage else {
-            throw AnalysisError.filterFailed
+    /// Laplacian sum and sum of squares over one band of interior rows.
+    private static func laplacianSums(_ luma: [UInt8], width: Int, rows: Range<Int>) -> (sum: Int, sumSquares: Int) {
+        luma.withUnsafeBufferPointer { plane in
+            var sum = 0
+            var sumSquares = 0
+
+            for y in rows {
+                let above = (y - 1) * width
+                let row = y * width
+                let below = (y + 1) * width
+
+                for x in 1..<(width - 1) {
+                    let vertical: Int = Int(plane[above + x]) + Int(plane[below + x])
+                    let horizontal: Int = Int(plane[row + x - 1]) + Int(plane[row + x + 1])
+                    let lap = 4 * Int(plane[row + x]) - (vertical + horizontal)
+                    sum += lap
+                    sumSquares += lap * lap
+                }
+            }
+            return (sum, sumSquares)
         }
+    }
 
-        // Render histogram to bitmap
-        var histData = [Float](repeating: 0, count: 256 * 4)
-        context.render(histFilter, toBitmap: &histData, rowBytes: 256 * 4 * MemoryLayout<Float>.size, bounds: CGRect(x: 0, y: 0, width: 256, height: 1), format: .RGBAf, colorSpace: nil)
-
-        // Extract red channel (grayscale, so all channels same)
-        var histogram = [Int](repeating: 0, count: 256)
-        for i in 0..<256 {
-            histogram[i] = Int(histData[i * 4] * 1000000)  // Scale up for integer math
+    /// 256-bin histogram of an 8-bit luma plane, counted with vImage.
+    private nonisolated func lumaHistogram(_ luma: [UInt8], width: Int, height: Int) -> [Int] {
+        var counts = [vImagePixelCount](repeating: 0, count: 256)
+        luma.withUnsafeBytes { lumaRaw in
+            // vImage only reads the source, so the const buffer is safe to hand over
+            var buffer = vImage_Buffer(
+                data: UnsafeMutableRawPointer(mutating: lumaRaw.baseAddress),
+                height: vImagePixelCount(height),
+                width: vImagePixelCount(width),
+                rowBytes: width)
+            _ = vImageHistogramCalculation_Planar8(&buffer, &counts, vImage_Flags(kvImageNoFlags))
         }
-
-        return histogram
+        return counts.map { Int($0) }
     }
 
-    private func calculatePercentile(histogram: [Int], percentile: CGFloat) -> CGFloat {
-        let total = histogram.reduce(0, +)
-        // max(1, ...) prevents target=0 at percentile=0.0, which triggers an
-        // immediate early return from the very first bin.
-        let target = max(1, Int(percentile * CGFloat(total)))
-
+    /// Running totals of a histogram: cdf[i] is the count of bins 0...i.
+    private nonisolated func cumulativeCounts(_ histogram: [Int]) -> [Int] {
         var running = 0
-        for (i, count) in histogram.enumerated() {
+        return histogram.map { count in
             running += count
-            if running >= target {
-                return CGFloat(i)
-            }
+            return running
         }
-
-        return 255.0
     }
 
-    private func calculateMean(histogram: [Int]) -> CGFloat {
-        let total = histogram.reduce(0, +)
-        guard total > 0 else { return 0 }
+    /// Index of the first bin whose cumulative count reaches the requested
+    /// percentile, found by binary search over the monotonic CDF.
+    private nonisolated func percentileBin(cdf: [Int], percentile: CGFloat) -> Int {
+        guard let total = cdf.last, total > 0 else { return max(0, cdf.count - 1) }
 
-        var sum: CGFloat = 0
-        for (i, count) in histogram.enumerated() {
-            sum += CGFloat(i * count)
-        }
-
-        return sum / CGFloat(total)
-    }
+        // max(1, ...) prevents target=0 at percentile=0.0, which would match
+        // bin 0 even when it holds no counts.
+        let target = max(1, Int(percentile * CGFloat(total)))
 
-    private func clamp(_ value: CGFloat, min minValue: CGFloat, max maxValue: CGFloat) -> CGFloat {
-        return max(minValue, min(maxValue, value))
+        var low = 0
+        var high = cdf.count - 1
+        while low < high {
+            let mid = (low + high) / 2
+            if cdf[mid] >= target {
+                high = mid
+            } else {
+                low = mid + 1
+            }
+        }
+        return low
     }
 }
 
 // MARK: - Errors
 
 enum AnalysisError: LocalizedError {
-    case filterFailed
     case invalidImage
 
     var errorDescription: String? {
         switch self {
-        case .filterFailed:
-            return "Image filter operation failed"
         case .invalidImage:
             return "Invalid image for analysis"
         }
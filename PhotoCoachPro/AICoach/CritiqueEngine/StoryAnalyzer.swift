@@ -17,13 +17,15 @@ actor StoryAnalyzer {
         self.context = context
     }
 
-    func analyze(_ image: CIImage) async throws -> CritiqueResult.CategoryScore {
+    /// - Parameter rendered: `image` already rendered to a CGImage for Vision, when
+    ///   the caller has one; otherwise it is rendered here.
+    func analyze(_ image: CIImage, rendered: CGImage? = nil) async throws -> CritiqueResult.CategoryScore {
         var score: Double = 0.0
         var issues: [String] = []
         var strengths: [String] = []
 
         // Analyze subject clarity
-        let subjectScore = try await analyzeSubjectClarity(image)
+        let subjectScore = try await analyzeSubjectClarity(image, rendered: rendered)
         score += subjectScore * 0.6
 
         if subjectScore > 0.7 {
@@ -54,8 +56,8 @@ actor StoryAnalyzer {
 
     // MARK: - Subject Clarity
 
-    private func analyzeSubjectClarity(_ image: CIImage) async throws -> Double {
-        guard let cgImage = context.createCGImage(image, from: image.extent) else {
+    private func analyzeSubjectClarity(_ image: CIImage, rendered: CGImage?) async throws -> Double {
+        guard let cgImage = rendered ?? context.createCGImage(image, from: image.extent) else {
             return 0.5
         }
 
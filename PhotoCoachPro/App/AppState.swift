@@ -10,6 +10,9 @@ import SwiftUI
 import CoreImage
 import Combine
 import Photos
+import OSLog
+
+private let logger = Logger(subsystem: "com.photocoachpro", category: "AppState")
 
 /// Central app state
 @MainActor
@@ -37,19 +40,26 @@ class AppState: ObservableObject {
     // Phase 5: Cloud sync (optional - gated on privacySettings.cloudSyncEnabled)
     var syncManager: SyncManager?
 
+    // Engines used only by their own screens are created on first access, so app
+    // launch doesn't pay for their CIContexts (and Metal setup) up front.
+
     // Phase 6: Export engine
-    let exportEngine: ExportEngine
+    private(set) lazy var exportEngine = ExportEngine()
 
     // Phase 5: Panorama and Upscaling
-    let panoramaStitcher: PanoramaStitcher
-    let dpiUpscaler: DPIUpscaler
+    private(set) lazy var panoramaStitcher = PanoramaStitcher()
+    private(set) lazy var dpiUpscaler = DPIUpscaler()
 
     // Quick metrics analyzer (lightweight, no AI/ML)
     let quickMetricsAnalyzer: QuickMetricsAnalyzer
 
+    // Full critique analyzer. Built on first use and then shared, so its CIContext
+    // and six sub-analyzers are set up once per process rather than per view init.
+    private(set) lazy var imageAnalyzer = ImageAnalyzer()
+
     // Masking engine
-    let autoMaskDetector: AutoMaskDetector
-    let maskRefinementBrush: MaskRefinementBrush
+    private(set) lazy var autoMaskDetector = AutoMaskDetector()
+    private(set) lazy var maskRefinementBrush = MaskRefinementBrush()
 
     // Masking state
     @Published var activeMasks: [MaskLayer] = []
@@ -64,7 +74,7 @@ class AppState: ObservableObject {
     // Current editing session
     @Published var currentPhoto: PhotoRecord? {
         didSet {
-            print("🔄 AppState.currentPhoto changed: \(currentPhoto?.fileName ?? "nil")")
+            logger.debug("currentPhoto changed: \(self.currentPhoto?.fileName ?? "nil", privacy: .private)")
         }
     }
     @Published var currentEditHistory: EditHistoryManager?
@@ -105,12 +115,12 @@ class AppState: ObservableObject {
 
         // Initialize actors and managers
         self.colorSpaceManager = ColorSpaceManager()
-        self.imageLoader = ImageLoader(colorSpaceManager: colorSpaceManager)
+        self.exifReader = EXIFReader()
+        self.imageLoader = ImageLoader(colorSpaceManager: colorSpaceManager, exifReader: exifReader)
         self.imageRenderer = ImageRenderer(colorSpaceManager: colorSpaceManager)
         // Use larger thumbnails for Retina displays (800x800 for crisp 2x/3x rendering)
         self.thumbnailCache = ThumbnailCache(thumbnailSize: CGSize(width: 800, height: 800))
         self.editGraphEngine = EditGraphEngine()
-        self.exifReader = EXIFReader()
 
         // Phase 1 managers
         self.presetManager = EditPresetManager()
@@ -133,20 +143,9 @@ class AppState: ObservableObject {
             self.syncManager = nil
         }
 
-        // Phase 6: Export engine
-        self.exportEngine = ExportEngine()
-
-        // Phase 5: Panorama and Upscaling
-        self.panoramaStitcher = PanoramaStitcher()
-        self.dpiUpscaler = DPIUpscaler()
-
         // Quick metrics analyzer
         self.quickMetricsAnalyzer = QuickMetricsAnalyzer()
 
-        // Masking engines
-        self.autoMaskDetector = AutoMaskDetector()
-        self.maskRefinementBrush = MaskRefinementBrush()
-
         // Subscribe to cloud sync setting changes (dropFirst prevents double-init on launch)
         syncSettingsCancellable = PrivacySettings.shared.$cloudSyncEnabled
             .dropFirst()
@@ -168,9 +167,9 @@ class AppState: ObservableObject {
         Task {
             do {
                 try await PresetLibrary.installBuiltInPresets(manager: customPresetManager)
-                print("✅ Built-in presets seeded successfully")
+                logger.info("Built-in presets seeded")
             } catch {
-                print("❌ Failed to seed built-in presets: \(error)")
+                logger.error("Failed to seed built-in presets: \(error.localizedDescription, privacy: .public)")
             }
         }
     }
@@ -247,11 +246,12 @@ class AppState: ObservableObject {
                 loaded = try await imageLoader.load(from: url)
             }
 
-            // Get file size (best effort)
-            let fileSize = (try? FileManager.default.attributesOfItem(atPath: url.path)[.size] as? Int64) ?? 0
+            // Get file size (best effort). A single resource-value lookup instead of
+            // attributesOfItem, which stats the file and builds the full attribute dictionary
+            let fileSize = Int64((try? url.resourceValues(forKeys: [.fileSizeKey]))?.fileSize ?? 0)
 
             let photo = PhotoRecord(
-                filePath: url.path,
+                filePath: PhotoRecord.storedPath(for: url),
                 fileName: url.lastPathComponent,
                 createdDate: loaded.metadata?.dateTimeOriginal ?? Date(),
                 width: Int(loaded.image.extent.width),
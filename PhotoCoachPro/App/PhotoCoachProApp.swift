@@ -98,7 +98,6 @@ struct CritiqueDashboardView: View {
     @State private var critiqueResult: CritiqueResult?
     @State private var quickMetricsResult: QuickMetricsResult?
     @State private var isAnalyzing = false
-    @State private var analyzer = ImageAnalyzer()
     @State private var analysisMode: AnalysisMode = .ai
 
     enum AnalysisMode {
@@ -241,11 +240,10 @@ struct CritiqueDashboardView: View {
 
         Task {
             do {
-                let loaded = try await appState.imageLoader.loadImage(for: photo)
-
                 if analysisMode == .ai {
                     // AI Coaching analysis
-                    let result = try await analyzer.analyze(loaded.image, photoID: photo.id)
+                    let loaded = try await appState.imageLoader.loadImage(for: photo)
+                    let result = try await appState.imageAnalyzer.analyze(loaded.image, photoID: photo.id)
 
                     let record = try CritiqueRecord.from(result)
                     try appState.database.saveCritique(record)
@@ -257,8 +255,17 @@ struct CritiqueDashboardView: View {
                         isAnalyzing = false
                     }
                 } else {
-                    // Quick metrics analysis
-                    let result = try await appState.quickMetricsAnalyzer.analyze(loaded.image)
+                    // Quick metrics analysis. Files are decoded by ImageIO straight to
+                    // analysis size; Photos library assets go through the loaded CIImage.
+                    let result: QuickMetricsResult
+                    if let url = try await appState.imageLoader.fileURL(for: photo) {
+                        let didAccess = url.startAccessingSecurityScopedResource()
+                        defer { if didAccess { url.stopAccessingSecurityScopedResource() } }
+                        result = try await appState.quickMetricsAnalyzer.analyze(contentsOf: url)
+                    } else {
+                        let loaded = try await appState.imageLoader.loadImage(for: photo)
+                        result = try await appState.quickMetricsAnalyzer.analyze(loaded.image)
+                    }
 
                     await MainActor.run {
                         quickMetricsResult = result
@@ -0,0 +1,46 @@
+//
+//  ConcurrentMap.swift
+//  PhotoCoachPro
+//
+//  Ordered, bounded-concurrency map for batch work
+//
+
+import Foundation
+
+extension Collection {
+    /// Transform every element with up to `maxConcurrent` calls in flight and
+    /// return the results in the collection's order.
+    /// A new call starts as soon as one finishes, so a slow element never
+    /// stalls the rest. The first error cancels the remaining work and is rethrown.
+    func concurrentMap<T>(
+        maxConcurrent: Int,
+        _ transform: @escaping (Element) async throws -> T
+    ) async throws -> [T] {
+        let elements = Array(self)
+        var results = [T?](repeating: nil, count: elements.count)
+
+        try await withThrowingTaskGroup(of: (Int, T).self) { group in
+            var nextIndex = 0
+
+            func enqueueNext() {
+                guard nextIndex < elements.count else { return }
+                let index = nextIndex
+                let element = elements[index]
+                nextIndex += 1
+                group.addTask {
+                    (index, try await transform(element))
+                }
+            }
+
+            for _ in 0..<max(1, maxConcurrent) {
+                enqueueNext()
+            }
+            while let (index, result) = try await group.next() {
+                results[index] = result
+                enqueueNext()
+            }
+        }
+
+        return results.compactMap { $0 }
+    }
+}
@@ -0,0 +1,28 @@
+//
+//  FileVersionKey.swift
+//  PhotoCoachPro
+//
+//  Cache key for one version of a file on disk
+//
+
+import Foundation
+
+/// Identifies one version of a file: any write changes the modification date
+/// or the size, so a cache keyed by it never returns stale entries.
+struct FileVersionKey: Hashable {
+    let path: String
+    let modificationDate: Date
+    let fileSize: Int
+
+    /// Nil when the file cannot be stat'ed; such reads simply bypass the cache
+    init?(url: URL) {
+        guard let values = try? url.resourceValues(forKeys: [.contentModificationDateKey, .fileSizeKey]),
+              let modificationDate = values.contentModificationDate,
+              let fileSize = values.fileSize else {
+            return nil
+        }
+        self.path = url.standardizedFileURL.path
+        self.modificationDate = modificationDate
+        self.fileSize = fileSize
+    }
+}
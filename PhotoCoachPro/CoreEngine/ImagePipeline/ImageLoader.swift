@@ -7,16 +7,19 @@
 import Foundation
 import CoreImage
 import CoreGraphics
+import ImageIO
 import UniformTypeIdentifiers
 import Photos
 
 /// Loads images from various sources into CIImage
 actor ImageLoader {
     private let colorSpaceManager: ColorSpaceManager
+    private let exifReader: EXIFReader
     private let loadTimeout: TimeInterval
 
-    init(colorSpaceManager: ColorSpaceManager, loadTimeout: TimeInterval = 30.0) {
+    init(colorSpaceManager: ColorSpaceManager, exifReader: EXIFReader = EXIFReader(), loadTimeout: TimeInterval = 30.0) {
         self.colorSpaceManager = colorSpaceManager
+        self.exifReader = exifReader
         self.loadTimeout = loadTimeout
     }
 
@@ -95,26 +98,7 @@ actor ImageLoader {
     /// - Parameter onRefresh: Called with the updated bookmark `Data` when the resolved bookmark was stale.
     func loadFromBookmark(data: Data, onRefresh: ((Data) -> Void)? = nil) async throws -> LoadedImage {
         var isStale = false
-
-        #if os(macOS)
-        guard let resolvedURL = try? URL(
-            resolvingBookmarkData: data,
-            options: .withSecurityScope,
-            relativeTo: nil,
-            bookmarkDataIsStale: &isStale
-        ) else {
-            throw ImageLoadError.bookmarkResolutionFailed
-        }
-        #else
-        guard let resolvedURL = try? URL(
-            resolvingBookmarkData: data,
-            options: [],
-            relativeTo: nil,
-            bookmarkDataIsStale: &isStale
-        ) else {
-            throw ImageLoadError.bookmarkResolutionFailed
-        }
-        #endif
+        let resolvedURL = try resolveBookmark(data, isStale: &isStale)
 
         let didAccess = resolvedURL.startAccessingSecurityScopedResource()
         defer { if didAccess { resolvedURL.stopAccessingSecurityScopedResource() } }
@@ -143,6 +127,29 @@ actor ImageLoader {
         return try await load(from: resolvedURL)
     }
 
+    private nonisolated func resolveBookmark(_ data: Data, isStale: inout Bool) throws -> URL {
+        #if os(macOS)
+        guard let resolvedURL = try? URL(
+            resolvingBookmarkData: data,
+            options: .withSecurityScope,
+            relativeTo: nil,
+            bookmarkDataIsStale: &isStale
+        ) else {
+            throw ImageLoadError.bookmarkResolutionFailed
+        }
+        #else
+        guard let resolvedURL = try? URL(
+            resolvingBookmarkData: data,
+            options: [],
+            relativeTo: nil,
+            bookmarkDataIsStale: &isStale
+        ) else {
+            throw ImageLoadError.bookmarkResolutionFailed
+        }
+        #endif
+        return resolvedURL
+    }
+
     // MARK: - Unified Router
 
     /// Load a photo using the appropriate method based on its source type
@@ -169,6 +176,51 @@ actor ImageLoader {
         }
     }
 
+    // MARK: - File Access
+
+    /// The file behind a file-backed photo: its bookmark when it has one, otherwise
+    /// the stored path. Returns nil for Photos library assets, which have no file.
+    /// Callers that read the file must bracket the read with
+    /// `startAccessingSecurityScopedResource()` / `stopAccessingSecurityScopedResource()`.
+    nonisolated func fileURL(for photo: PhotoRecord) async throws -> URL? {
+        guard photo.resolvedSourceType == .fileSystem else { return nil }
+
+        if let bookmark = photo.bookmarkData {
+            var isStale = false
+            return try resolveBookmark(bookmark, isStale: &isStale)
+        }
+        return photo.fileURL
+    }
+
+    // MARK: - Thumbnails
+
+    /// Decode a reduced-size image for grid display without materialising the full frame.
+    /// ImageIO scales JPEGs inside the decoder (IDCT scaling), so the cost tracks
+    /// `maxPixelSize` rather than the file's resolution.
+    /// Returns nil for Photos library assets, which have no file to read.
+    /// Touches no actor state, so grid cells decode in parallel instead of one at a time.
+    nonisolated func loadThumbnail(for photo: PhotoRecord, maxPixelSize: Int) async throws -> CGImage? {
+        guard let url = try await fileURL(for: photo) else { return nil }
+
+        let didAccess = url.startAccessingSecurityScopedResource()
+        defer { if didAccess { url.stopAccessingSecurityScopedResource() } }
+
+        guard let source = CGImageSourceCreateWithURL(url as CFURL, [kCGImageSourceShouldCache: false] as CFDictionary) else {
+            throw ImageLoadError.fileNotFound
+        }
+
+        let options: [CFString: Any] = [
+            kCGImageSourceCreateThumbnailFromImageAlways: true,
+            kCGImageSourceCreateThumbnailWithTransform: true,
+            kCGImageSourceShouldCacheImmediately: true,
+            kCGImageSourceThumbnailMaxPixelSize: maxPixelSize
+        ]
+        guard let thumbnail = CGImageSourceCreateThumbnailAtIndex(source, 0, options as CFDictionary) else {
+            throw ImageLoadError.invalidImage
+        }
+        return thumbnail
+    }
+
     // MARK: - Timeout Wrapper
 
     private func withTimeout<T>(_ timeout: TimeInterval, operation: @escaping () async throws -> T) async throws -> T {
@@ -202,9 +254,9 @@ actor ImageLoader {
             throw ImageLoadError.invalidImage
         }
 
-        // Extract metadata
-        let properties = ciImage.properties
-        let exifData = extractEXIF(from: properties)
+        // File metadata comes from the EXIF reader: it reports pixel dimensions with
+        // orientation applied and serves repeat opens of an unchanged file from its cache
+        let exifData = try? await exifReader.readMetadata(from: url).exif
 
         // Convert to working color space
         let workingImage = await colorSpaceManager.convertToWorkingSpace(ciImage)
@@ -229,9 +281,7 @@ actor ImageLoader {
             throw ImageLoadError.rawDecodingFailed
         }
 
-        // Extract RAW properties
-        let properties = ciImage.properties
-        let exifData = extractEXIF(from: properties)
+        let exifData = try? await exifReader.readMetadata(from: url).exif
 
         // Convert to working color space
         let workingImage = await colorSpaceManager.convertToWorkingSpace(ciImage)
@@ -247,16 +297,17 @@ actor ImageLoader {
 
     // MARK: - File Type Detection
 
+    private static let standardExtensions: Set<String> = ["jpg", "jpeg", "png", "heic", "heif", "tiff", "tif"]
+
     private func detectFileType(url: URL) throws -> FileType {
         let ext = url.pathExtension.lowercased()
 
-        let rawExtensions = ["dng", "nef", "cr2", "cr3", "arw", "orf", "raf", "rw2", "raw"]
-        if rawExtensions.contains(ext) {
+        // Same table PhotoRecord.isRAW uses, so loader and library agree on RAW files
+        if RAWFormat.isRAWFormat(ext) {
             return .raw
         }
 
-        let standardExtensions = ["jpg", "jpeg", "png", "heic", "heif", "tiff", "tif"]
-        if standardExtensions.contains(ext) {
+        if Self.standardExtensions.contains(ext) {
             return .standard
         }
 
@@ -274,44 +325,41 @@ actor ImageLoader {
 
         // Camera info
         let tiffDict = properties[kCGImagePropertyTIFFDictionary as String] as? [String: Any]
-        exif.cameraMake = tiffDict?[kCGImagePropertyTIFFMake as String] as? String
-        exif.cameraModel = tiffDict?[kCGImagePropertyTIFFModel as String] as? String
+        exif.cameraMake = EXIFData.normalizedText(tiffDict?[kCGImagePropertyTIFFMake as String])
+        exif.cameraModel = EXIFData.normalizedText(tiffDict?[kCGImagePropertyTIFFModel as String])
 
-        // Exposure settings
-        exif.exposureTime = exifDict[kCGImagePropertyExifExposureTime as String] as? String
-        exif.fNumber = exifDict[kCGImagePropertyExifFNumber as String] as? Double
-        exif.iso = exifDict[kCGImagePropertyExifISOSpeedRatings as String] as? Int
-        exif.exposureBias = exifDict[kCGImagePropertyExifExposureBiasValue as String] as? Double
+        // Exposure settings — ImageIO stores every numeric tag as NSNumber (ISO as an
+        // array of them), so read the number directly instead of probing Swift types
+        if let expTime = (exifDict[kCGImagePropertyExifExposureTime as String] as? NSNumber)?.doubleValue {
+            exif.exposureTime = EXIFData.formattedExposureTime(expTime)
+        }
+        exif.fNumber = (exifDict[kCGImagePropertyExifFNumber as String] as? NSNumber)?.doubleValue
+        exif.iso = (exifDict[kCGImagePropertyExifISOSpeedRatings as String] as? [NSNumber])?.first?.intValue
+        exif.exposureBias = (exifDict[kCGImagePropertyExifExposureBiasValue as String] as? NSNumber)?.doubleValue
 
         // Lens info
-        exif.focalLength = exifDict[kCGImagePropertyExifFocalLength as String] as? Double
-        exif.focalLength35mmEquiv = exifDict[kCGImagePropertyExifFocalLenIn35mmFilm as String] as? Double
+        exif.focalLength = (exifDict[kCGImagePropertyExifFocalLength as String] as? NSNumber)?.doubleValue
+        exif.focalLength35mmEquiv = (exifDict[kCGImagePropertyExifFocalLenIn35mmFilm as String] as? NSNumber)?.doubleValue
 
         // Dates
         if let dateString = exifDict[kCGImagePropertyExifDateTimeOriginal as String] as? String {
-            exif.dateTimeOriginal = parseEXIFDate(dateString)
+            exif.dateTimeOriginal = EXIFData.parseDate(dateString)
         }
 
         // GPS
         if let gpsDict = properties[kCGImagePropertyGPSDictionary as String] as? [String: Any] {
-            exif.gpsLatitude = gpsDict[kCGImagePropertyGPSLatitude as String] as? Double
-            exif.gpsLongitude = gpsDict[kCGImagePropertyGPSLongitude as String] as? Double
-            exif.gpsAltitude = gpsDict[kCGImagePropertyGPSAltitude as String] as? Double
+            exif.gpsLatitude = (gpsDict[kCGImagePropertyGPSLatitude as String] as? NSNumber)?.doubleValue
+            exif.gpsLongitude = (gpsDict[kCGImagePropertyGPSLongitude as String] as? NSNumber)?.doubleValue
+            exif.gpsAltitude = (gpsDict[kCGImagePropertyGPSAltitude as String] as? NSNumber)?.doubleValue
         }
 
         // Color space
-        let colorSpaceInt = exifDict[kCGImagePropertyExifColorSpace as String] as? Int
+        let colorSpaceInt = (exifDict[kCGImagePropertyExifColorSpace as String] as? NSNumber)?.intValue
         exif.colorSpace = colorSpaceInt == 1 ? "sRGB" : "Uncalibrated"
 
         return exif
     }
 
-    private func parseEXIFDate(_ dateString: String) -> Date? {
-        let formatter = DateFormatter()
-        formatter.dateFormat = "yyyy:MM:dd HH:mm:ss"
-        return formatter.date(from: dateString)
-    }
-
     // MARK: - Supporting Types
 
     enum FileType {
@@ -0,0 +1,62 @@
+//
+//  LRUCache.swift
+//  PhotoCoachPro
+//
+//  Bounded least-recently-used store behind the in-memory caches
+//
+
+import Foundation
+
+/// Bounded key-value store that evicts the least recently used entry when full.
+/// It has no locking of its own; each cache keeps one inside an actor.
+struct LRUCache<Key: Hashable, Value> {
+    let capacity: Int
+    private var entries: [Key: Entry] = [:]
+    private var clock: UInt64 = 0
+
+    init(capacity: Int) {
+        self.capacity = capacity
+    }
+
+    var count: Int {
+        entries.count
+    }
+
+    /// Returns the value for `key` and marks it as the most recently used
+    mutating func value(for key: Key) -> Value? {
+        guard let entry = entries[key] else { return nil }
+        entries[key] = Entry(value: entry.value, lastAccess: tick())
+        return entry.value
+    }
+
+    /// Stores `value`, evicting the least recently used entry when over capacity
+    mutating func setValue(_ value: Value, for key: Key) {
+        entries[key] = Entry(value: value, lastAccess: tick())
+
+        if entries.count > capacity {
+            evictOldest()
+        }
+    }
+
+    mutating func removeAll() {
+        entries.removeAll()
+    }
+
+    /// A counter rather than a timestamp, so two accesses never tie
+    private mutating func tick() -> UInt64 {
+        clock += 1
+        return clock
+    }
+
+    private mutating func evictOldest() {
+        guard let oldestKey = entries.min(by: { $0.value.lastAccess < $1.value.lastAccess })?.key else {
+            return
+        }
+        entries.removeValue(forKey: oldestKey)
+    }
+
+    private struct Entry {
+        let value: Value
+        let lastAccess: UInt64
+    }
+}
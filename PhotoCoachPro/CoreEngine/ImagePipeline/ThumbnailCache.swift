@@ -17,16 +17,15 @@ import AppKit
 
 /// Fast thumbnail cache with LRU eviction
 actor ThumbnailCache {
-    private var cache: [CacheKey: CachedThumbnail] = [:]
-    private let maxCacheSize: Int
-    private let thumbnailSize: CGSize
+    private var cache: LRUCache<CacheKey, PlatformImage>
+    let thumbnailSize: CGSize
     private let context: CIContext
 
     init(
         maxCacheSize: Int = 200,
         thumbnailSize: CGSize = CGSize(width: 300, height: 300)
     ) {
-        self.maxCacheSize = maxCacheSize
+        self.cache = LRUCache(capacity: maxCacheSize)
         self.thumbnailSize = thumbnailSize
         self.context = CIContext(options: [.useSoftwareRenderer: false])
     }
@@ -34,23 +33,19 @@ actor ThumbnailCache {
     // MARK: - Cache Access
 
     func thumbnail(for key: CacheKey) -> PlatformImage? {
-        guard let cached = cache[key] else { return nil }
-
-        // Update access time (LRU)
-        var updated = cached
-        updated.lastAccessTime = Date()
-        cache[key] = updated
-
-        return cached.image
+        cache.value(for: key)
     }
 
     func setThumbnail(_ image: PlatformImage, for key: CacheKey) {
-        cache[key] = CachedThumbnail(image: image)
+        cache.setValue(image, for: key)
+    }
 
-        // Evict if over limit
-        if cache.count > maxCacheSize {
-            evictOldest()
-        }
+    /// Cache a thumbnail that was already decoded at reduced size
+    /// (see `ImageLoader.loadThumbnail(for:maxPixelSize:)`).
+    func setThumbnail(_ cgImage: CGImage, for key: CacheKey) -> PlatformImage {
+        let image = platformImage(from: cgImage)
+        setThumbnail(image, for: key)
+        return image
     }
 
     func clearCache() {
@@ -101,6 +96,10 @@ actor ThumbnailCache {
             return nil
         }
 
+        return platformImage(from: cgImage)
+    }
+
+    private func platformImage(from cgImage: CGImage) -> PlatformImage {
         #if canImport(UIKit)
         return UIImage(cgImage: cgImage)
         #elseif canImport(AppKit)
@@ -108,15 +107,6 @@ actor ThumbnailCache {
         #endif
     }
 
-    // MARK: - LRU Eviction
-
-    private func evictOldest() {
-        guard let oldestKey = cache.min(by: { $0.value.lastAccessTime < $1.value.lastAccessTime })?.key else {
-            return
-        }
-        cache.removeValue(forKey: oldestKey)
-    }
-
     // MARK: - Cache Key
 
     struct CacheKey: Hashable {
@@ -129,14 +119,4 @@ actor ThumbnailCache {
             self.editHash = "\(editStack.count)-\(editStack.map { "\($0.type.rawValue):\($0.value)" }.joined(separator: "|"))"
         }
     }
-
-    private struct CachedThumbnail {
-        let image: PlatformImage
-        var lastAccessTime: Date
-
-        init(image: PlatformImage) {
-            self.image = image
-            self.lastAccessTime = Date()
-        }
-    }
 }
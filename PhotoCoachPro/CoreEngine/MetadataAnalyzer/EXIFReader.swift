@@ -8,129 +8,311 @@
 import Foundation
 import CoreGraphics
 import ImageIO
+import UniformTypeIdentifiers
 
 /// Reads metadata from image files
 actor EXIFReader {
+    private var cache: LRUCache<FileVersionKey, PhotoMetadata>
+
+    /// Bytes read from the start of a file for the fast path. JPEG APP1/APP13,
+    /// TIFF-based RAW IFDs and the HEIF meta box all sit near the front, so the
+    /// header is usually enough without pulling a multi-megabyte file from disk.
+    private static let headerReadLength = 128 * 1024
+
+    /// File types whose camera metadata lives in a TIFF structure near the start
+    /// of the file. Everything else (PNG, GIF, HEIF, screenshots) goes straight
+    /// to the full read instead of being read twice.
+    private static let headerReadableTypes: [UTType] = [.jpeg, .tiff, .rawImage]
+
+    init(maxCacheSize: Int = 512) {
+        self.cache = LRUCache(capacity: maxCacheSize)
+    }
 
     // MARK: - Read Complete Metadata
 
     func readMetadata(from url: URL) async throws -> PhotoMetadata {
+        // Files that have not changed since the last read are served from the cache
+        let key = FileVersionKey(url: url)
+        if let key, let cached = cachedMetadata(for: key) {
+            return cached
+        }
+
+        let metadata = try await parseMetadata(from: url)
+
+        if let key {
+            setCachedMetadata(metadata, for: key)
+        }
+        return metadata
+    }
+
+    /// Runs off the actor, so concurrent `readMetadata` calls overlap their file I/O
+    /// instead of queueing behind one another; only cache access is serialized.
+    private nonisolated func parseMetadata(from url: URL) async throws -> PhotoMetadata {
+        try autoreleasepool { () throws -> PhotoMetadata in
+            let properties = try readProperties(from: url)
+
+            let exif = extractEXIF(from: properties)
+            let iptc = extractIPTC(from: properties)
+
+            return PhotoMetadata(exif: exif, iptc: iptc)
+        }
+    }
+
+    /// ImageIO properties for the first image in a file: parsed from the header
+    /// when that is enough, otherwise from the whole file.
+    nonisolated func readProperties(from url: URL) throws -> NSDictionary {
+        try headerProperties(of: url) ?? fullProperties(of: url)
+    }
+
+    /// Parses properties from the first `headerReadLength` bytes only.
+    /// Returns nil when the header is not enough (not a JPEG or TIFF-based file,
+    /// an Exif or GPS IFD past the header, or no dimensions or Exif dictionary),
+    /// in which case the caller falls back to the whole file.
+    nonisolated func headerProperties(of url: URL) -> NSDictionary? {
+        guard let type = UTType(filenameExtension: url.pathExtension),
+              Self.headerReadableTypes.contains(where: { type.conforms(to: $0) }) else {
+            return nil
+        }
+
+        guard let handle = try? FileHandle(forReadingFrom: url) else { return nil }
+        defer { try? handle.close() }
+
+        guard let header = try? handle.read(upToCount: Self.headerReadLength), !header.isEmpty else {
+            return nil
+        }
+
+        // ImageIO quietly omits a dictionary whose IFD lies past the bytes it was given
+        guard Self.referencedIFDsAreInHeader(header) else { return nil }
+
+        let source = CGImageSourceCreateIncremental(nil)
+        CGImageSourceUpdateData(source, header as CFData, header.count < Self.headerReadLength)
+
+        guard let properties = CGImageSourceCopyPropertiesAtIndex(source, 0, nil) as NSDictionary?,
+              properties[kCGImagePropertyPixelWidth] != nil,
+              properties[kCGImagePropertyExifDictionary] != nil else {
+            return nil
+        }
+        return properties
+    }
+
+    /// Whether IFD0 and the Exif and GPS IFDs it points to all lie inside `header`.
+    /// Recognises JPEG (TIFF structure in the Exif APP1 segment) and files that
+    /// start with a TIFF header (TIFF, DNG and most RAW formats); false otherwise.
+    static func referencedIFDsAreInHeader(_ header: Data) -> Bool {
+        let bytes = [UInt8](header)
+        guard let tiffStart = tiffHeaderOffset(in: bytes), tiffStart + 8 <= bytes.count else { return false }
+
+        let bigEndian: Bool
+        switch (bytes[tiffStart], bytes[tiffStart + 1]) {
+        case (0x49, 0x49): bigEndian = false    // "II"
+        case (0x4D, 0x4D): bigEndian = true     // "MM"
+        default: return false
+        }
+
+        func integer(at index: Int, size: Int) -> Int? {
+            guard index >= 0, index + size <= bytes.count else { return nil }
+            let range = index..<(index + size)
+            return bigEndian
+                ? bytes[range].reduce(0) { $0 << 8 | Int($1) }
+                : bytes[range].reversed().reduce(0) { $0 << 8 | Int($1) }
+        }
+
+        /// Entry count of the IFD at `offset`, if the whole IFD is in the header
+        func entryCount(ofIFDAt offset: Int) -> Int? {
+            let start = tiffStart + offset
+            guard let count = integer(at: start, size: 2),
+                  start + 2 + count * 12 + 4 <= bytes.count else {
+                return nil
+            }
+            return count
+        }
+
+        guard let ifd0 = integer(at: tiffStart + 4, size: 4),
+              let count = entryCount(ofIFDAt: ifd0) else {
+            return false
+        }
+
+        let exifIFDPointer = 0x8769
+        let gpsIFDPointer = 0x8825
+        for index in 0..<count {
+            let entry = tiffStart + ifd0 + 2 + index * 12
+            guard let tag = integer(at: entry, size: 2),
+                  tag == exifIFDPointer || tag == gpsIFDPointer else {
+                continue
+            }
+            guard let offset = integer(at: entry + 8, size: 4),
+                  entryCount(ofIFDAt: offset) != nil else {
+                return false
+            }
+        }
+        return true
+    }
+
+    /// Byte offset of the TIFF header: 0 for TIFF-based files, or the start of
+    /// the Exif payload for a JPEG whose Exif APP1 segment is entirely in `bytes`.
+    private static func tiffHeaderOffset(in bytes: [UInt8]) -> Int? {
+        if bytes.starts(with: [0x49, 0x49, 0x2A, 0x00]) || bytes.starts(with: [0x4D, 0x4D, 0x00, 0x2A]) {
+            return 0
+        }
+
+        guard bytes.starts(with: [0xFF, 0xD8]) else { return nil }
+
+        let exifIdentifier: [UInt8] = [0x45, 0x78, 0x69, 0x66, 0x00, 0x00]    // "Exif\0\0"
+        var offset = 2
+        while offset + 4 <= bytes.count, bytes[offset] == 0xFF {
+            let marker = bytes[offset + 1]
+            // Metadata segments all precede the start of scan
+            if marker == 0xDA { return nil }
+
+            let length = Int(bytes[offset + 2]) << 8 | Int(bytes[offset + 3])
+            if marker == 0xE1, bytes[(offset + 4)...].starts(with: exifIdentifier) {
+                guard offset + 2 + length <= bytes.count else { return nil }
+                return offset + 4 + exifIdentifier.count
+            }
+            offset += 2 + length
+        }
+        return nil
+    }
+
+    nonisolated func fullProperties(of url: URL) throws -> NSDictionary {
         guard let imageSource = CGImageSourceCreateWithURL(url as CFURL, nil) else {
             throw MetadataError.cannotReadFile
         }
 
-        guard let properties = CGImageSourceCopyPropertiesAtIndex(imageSource, 0, nil) as? [String: Any] else {
+        // Keep the top level as an NSDictionary: bridging it to [String: Any] would
+        // convert every entry, including MakerNote and other sub-dictionaries we never read
+        guard let properties = CGImageSourceCopyPropertiesAtIndex(imageSource, 0, nil) as NSDictionary? else {
             throw MetadataError.noMetadata
         }
+        return properties
+    }
 
-        let exif = extractEXIF(from: properties)
-        let iptc = extractIPTC(from: properties)
+    // MARK: - Cache
 
-        return PhotoMetadata(exif: exif, iptc: iptc)
+    private func cachedMetadata(for key: FileVersionKey) -> PhotoMetadata? {
+        cache.value(for: key)
+    }
+
+    private func setCachedMetadata(_ metadata: PhotoMetadata, for key: FileVersionKey) {
+        cache.setValue(metadata, for: key)
+    }
+
+    func cachedMetadataCount() -> Int {
+        cache.count
     }
 
     // MARK: - EXIF Extraction
 
-    private func extractEXIF(from properties: [String: Any]) -> EXIFData {
+    private nonisolated func extractEXIF(from properties: NSDictionary) -> EXIFData {
         var exif = EXIFData()
 
+        // Sub-dictionaries stay NSDictionary as well, and are keyed by the CFString
+        // constants directly: only the handful of tags read here are ever bridged.
+        // ImageIO stores every numeric tag as NSNumber, rationals included, so numbers
+        // are read through NSNumber; a Swift `as? Int` misses tags stored as floats
+
         // TIFF dictionary (camera info)
-        if let tiffDict = properties[kCGImagePropertyTIFFDictionary as String] as? [String: Any] {
-            exif.cameraMake = tiffDict[kCGImagePropertyTIFFMake as String] as? String
-            exif.cameraModel = tiffDict[kCGImagePropertyTIFFModel as String] as? String
-            exif.software = tiffDict[kCGImagePropertyTIFFSoftware as String] as? String
-            exif.orientation = tiffDict[kCGImagePropertyTIFFOrientation as String] as? Int
+        if let tiffDict = properties[kCGImagePropertyTIFFDictionary] as? NSDictionary {
+            exif.cameraMake = EXIFData.normalizedText(tiffDict[kCGImagePropertyTIFFMake])
+            exif.cameraModel = EXIFData.normalizedText(tiffDict[kCGImagePropertyTIFFModel])
+            exif.software = EXIFData.normalizedText(tiffDict[kCGImagePropertyTIFFSoftware])
+            exif.orientation = (tiffDict[kCGImagePropertyTIFFOrientation] as? NSNumber)?.intValue
         }
 
         // EXIF dictionary
-        if let exifDict = properties[kCGImagePropertyExifDictionary as String] as? [String: Any] {
+        if let exifDict = properties[kCGImagePropertyExifDictionary] as? NSDictionary {
             // Exposure settings
-            if let expTime = exifDict[kCGImagePropertyExifExposureTime as String] as? Double {
-                exif.exposureTime = formatExposureTime(expTime)
+            if let expTime = (exifDict[kCGImagePropertyExifExposureTime] as? NSNumber)?.doubleValue {
+                exif.exposureTime = EXIFData.formattedExposureTime(expTime)
             }
-            exif.fNumber = exifDict[kCGImagePropertyExifFNumber as String] as? Double
+            exif.fNumber = (exifDict[kCGImagePropertyExifFNumber] as? NSNumber)?.doubleValue
+            exif.iso = ((exifDict[kCGImagePropertyExifISOSpeedRatings] as? NSArray)?.firstObject as? NSNumber)?.intValue
+            exif.exposureBias = (exifDict[kCGImagePropertyExifExposureBiasValue] as? NSNumber)?.doubleValue
 
-            if let isoArray = exifDict[kCGImagePropertyExifISOSpeedRatings as String] as? [Int], let iso = isoArray.first {
-                exif.iso = iso
-            }
-
-            exif.exposureBias = exifDict[kCGImagePropertyExifExposureBiasValue as String] as? Double
-
-            if let expProgram = exifDict[kCGImagePropertyExifExposureProgram as String] as? Int {
+            if let expProgram = (exifDict[kCGImagePropertyExifExposureProgram] as? NSNumber)?.intValue {
                 exif.exposureProgram = formatExposureProgram(expProgram)
             }
 
             // Focus
-            exif.focalLength = exifDict[kCGImagePropertyExifFocalLength as String] as? Double
-            exif.focalLength35mmEquiv = exifDict[kCGImagePropertyExifFocalLenIn35mmFilm as String] as? Double
+            exif.focalLength = (exifDict[kCGImagePropertyExifFocalLength] as? NSNumber)?.doubleValue
+            exif.focalLength35mmEquiv = (exifDict[kCGImagePropertyExifFocalLenIn35mmFilm] as? NSNumber)?.doubleValue
 
             // Lens
-            exif.lensMake = exifDict[kCGImagePropertyExifLensMake as String] as? String
-            exif.lensModel = exifDict[kCGImagePropertyExifLensModel as String] as? String
+            exif.lensMake = EXIFData.normalizedText(exifDict[kCGImagePropertyExifLensMake])
+            exif.lensModel = EXIFData.normalizedText(exifDict[kCGImagePropertyExifLensModel])
 
             // Dates
-            if let dateString = exifDict[kCGImagePropertyExifDateTimeOriginal as String] as? String {
-                exif.dateTimeOriginal = parseEXIFDate(dateString)
+            if let dateString = exifDict[kCGImagePropertyExifDateTimeOriginal] as? String {
+                exif.dateTimeOriginal = EXIFData.parseDate(dateString)
             }
-            if let dateString = exifDict[kCGImagePropertyExifDateTimeDigitized as String] as? String {
-                exif.dateTimeDigitized = parseEXIFDate(dateString)
+            if let dateString = exifDict[kCGImagePropertyExifDateTimeDigitized] as? String {
+                exif.dateTimeDigitized = EXIFData.parseDate(dateString)
             }
 
             // Color space
-            if let colorSpaceInt = exifDict[kCGImagePropertyExifColorSpace as String] as? Int {
+            if let colorSpaceInt = (exifDict[kCGImagePropertyExifColorSpace] as? NSNumber)?.intValue {
                 exif.colorSpace = colorSpaceInt == 1 ? "sRGB" : (colorSpaceInt == 65535 ? "Uncalibrated" : "Unknown")
             }
 
             // White balance
-            if let wbInt = exifDict[kCGImagePropertyExifWhiteBalance as String] as? Int {
+            if let wbInt = (exifDict[kCGImagePropertyExifWhiteBalance] as? NSNumber)?.intValue {
                 exif.whiteBalance = wbInt == 0 ? "Auto" : "Manual"
             }
 
             // Metering mode
-            if let meteringInt = exifDict[kCGImagePropertyExifMeteringMode as String] as? Int {
+            if let meteringInt = (exifDict[kCGImagePropertyExifMeteringMode] as? NSNumber)?.intValue {
                 exif.meteringMode = formatMeteringMode(meteringInt)
             }
 
             // Flash
-            if let flashInt = exifDict[kCGImagePropertyExifFlash as String] as? Int {
+            if let flashInt = (exifDict[kCGImagePropertyExifFlash] as? NSNumber)?.intValue {
                 exif.flash = flashInt == 0 ? "No Flash" : "Flash Fired"
             }
         }
 
         // GPS dictionary
-        if let gpsDict = properties[kCGImagePropertyGPSDictionary as String] as? [String: Any] {
-            exif.gpsLatitude = gpsDict[kCGImagePropertyGPSLatitude as String] as? Double
-            exif.gpsLongitude = gpsDict[kCGImagePropertyGPSLongitude as String] as? Double
-            exif.gpsAltitude = gpsDict[kCGImagePropertyGPSAltitude as String] as? Double
+        if let gpsDict = properties[kCGImagePropertyGPSDictionary] as? NSDictionary {
+            exif.gpsLatitude = (gpsDict[kCGImagePropertyGPSLatitude] as? NSNumber)?.doubleValue
+            exif.gpsLongitude = (gpsDict[kCGImagePropertyGPSLongitude] as? NSNumber)?.doubleValue
+            exif.gpsAltitude = (gpsDict[kCGImagePropertyGPSAltitude] as? NSNumber)?.doubleValue
         }
 
-        // Image dimensions
-        exif.pixelWidth = properties[kCGImagePropertyPixelWidth as String] as? Int
-        exif.pixelHeight = properties[kCGImagePropertyPixelHeight as String] as? Int
+        // Image dimensions as displayed. Orientations 5-8 rotate by 90°, so swap the
+        // stored header dimensions instead of decoding the image to find out.
+        let width = (properties[kCGImagePropertyPixelWidth] as? NSNumber)?.intValue
+        let height = (properties[kCGImagePropertyPixelHeight] as? NSNumber)?.intValue
+        let orientation = (properties[kCGImagePropertyOrientation] as? NSNumber)?.intValue ?? exif.orientation
+        if let orientation, (5...8).contains(orientation) {
+            exif.pixelWidth = height
+            exif.pixelHeight = width
+        } else {
+            exif.pixelWidth = width
+            exif.pixelHeight = height
+        }
 
         return exif
     }
 
     // MARK: - IPTC Extraction
 
-    private func extractIPTC(from properties: [String: Any]) -> IPTCData {
+    private nonisolated func extractIPTC(from properties: NSDictionary) -> IPTCData {
         var iptc = IPTCData()
 
-        guard let iptcDict = properties[kCGImagePropertyIPTCDictionary as String] as? [String: Any] else {
+        guard let iptcDict = properties[kCGImagePropertyIPTCDictionary] as? NSDictionary else {
             return iptc
         }
 
-        iptc.creator = iptcDict[kCGImagePropertyIPTCCreatorContactInfo as String] as? String
-        iptc.copyright = iptcDict[kCGImagePropertyIPTCCopyrightNotice as String] as? String
-        iptc.caption = iptcDict[kCGImagePropertyIPTCCaptionAbstract as String] as? String
-        iptc.headline = iptcDict[kCGImagePropertyIPTCHeadline as String] as? String
-        iptc.credit = iptcDict[kCGImagePropertyIPTCCredit as String] as? String
-        iptc.source = iptcDict[kCGImagePropertyIPTCSource as String] as? String
-        iptc.city = iptcDict[kCGImagePropertyIPTCCity as String] as? String
-        iptc.state = iptcDict[kCGImagePropertyIPTCProvinceState as String] as? String
-        iptc.country = iptcDict[kCGImagePropertyIPTCCountryPrimaryLocationName as String] as? String
-
-        if let keywords = iptcDict[kCGImagePropertyIPTCKeywords as String] as? [String] {
+        iptc.creator = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCCreatorContactInfo])
+        iptc.copyright = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCCopyrightNotice])
+        iptc.caption = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCCaptionAbstract])
+        iptc.headline = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCHeadline])
+        iptc.credit = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCCredit])
+        iptc.source = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCSource])
+        iptc.city = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCCity])
+        iptc.state = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCProvinceState])
+        iptc.country = EXIFData.normalizedText(iptcDict[kCGImagePropertyIPTCCountryPrimaryLocationName])
+
+        if let keywords = iptcDict[kCGImagePropertyIPTCKeywords] as? [String] {
             iptc.keywords = keywords
         }
 
@@ -139,16 +321,7 @@ actor EXIFReader {
 
     // MARK: - Helper Formatters
 
-    private func formatExposureTime(_ seconds: Double) -> String {
-        if seconds >= 1 {
-            return String(format: "%.1fs", seconds)
-        } else {
-            let denominator = Int(1.0 / seconds)
-            return "1/\(denominator)"
-        }
-    }
-
-    private func formatExposureProgram(_ value: Int) -> String {
+    private nonisolated func formatExposureProgram(_ value: Int) -> String {
         switch value {
         case 0: return "Not Defined"
         case 1: return "Manual"
@@ -163,7 +336,7 @@ actor EXIFReader {
         }
     }
 
-    private func formatMeteringMode(_ value: Int) -> String {
+    private nonisolated func formatMeteringMode(_ value: Int) -> String {
         switch value {
         case 0: return "Unknown"
         case 1: return "Average"
@@ -175,12 +348,6 @@ actor EXIFReader {
         default: return "Other"
         }
     }
-
-    private func parseEXIFDate(_ dateString: String) -> Date? {
-        let formatter = DateFormatter()
-        formatter.dateFormat = "yyyy:MM:dd HH:mm:ss"
-        return formatter.date(from: dateString)
-    }
 }
 
 // MARK: - Errors
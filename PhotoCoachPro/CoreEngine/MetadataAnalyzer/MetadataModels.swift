@@ -40,7 +40,7 @@ struct EXIFData: Codable, Equatable {
 
     // Image properties
     var colorSpace: String?             // sRGB, Display P3, Adobe RGB
-    var pixelWidth: Int?
+    var pixelWidth: Int?                // Displayed size, orientation applied
     var pixelHeight: Int?
     var orientation: Int?               // EXIF orientation (1-8)
 
@@ -61,6 +61,39 @@ struct EXIFData: Codable, Equatable {
             timestamp: dateTimeOriginal ?? Date()
         )
     }
+
+    /// Formats an exposure time in seconds the way cameras display it ("1/250", "2.0s")
+    static func formattedExposureTime(_ seconds: Double) -> String? {
+        guard seconds > 0, seconds.isFinite else { return nil }
+        if seconds >= 1 {
+            return String(format: "%.1fs", seconds)
+        } else {
+            return "1/\(Int((1.0 / seconds).rounded()))"
+        }
+    }
+
+    /// Cleans an ImageIO string tag. Camera firmware often pads fixed-width ASCII
+    /// fields such as Make and Model with NULs or spaces; blank values become nil.
+    static func normalizedText(_ value: Any?) -> String? {
+        guard let string = value as? String else { return nil }
+        let trimmed = string.trimmingCharacters(in: textPadding)
+        return trimmed.isEmpty ? nil : trimmed
+    }
+
+    private static let textPadding = CharacterSet.whitespacesAndNewlines.union(CharacterSet(charactersIn: "\0"))
+
+    /// Parses an EXIF timestamp ("2024:06:01 14:30:00"). The layout is fixed, so
+    /// one POSIX formatter is shared by every reader and never follows user locale.
+    static func parseDate(_ string: String) -> Date? {
+        exifDateFormatter.date(from: string)
+    }
+
+    private static let exifDateFormatter: DateFormatter = {
+        let formatter = DateFormatter()
+        formatter.locale = Locale(identifier: "en_US_POSIX")
+        formatter.dateFormat = "yyyy:MM:dd HH:mm:ss"
+        return formatter
+    }()
 }
 
 /// IPTC/XMP metadata
@@ -9,6 +9,9 @@ import Foundation
 import CoreImage
 import CoreGraphics
 import Vision
+import OSLog
+
+private let logger = Logger(subsystem: "com.photocoachpro", category: "PanoramaStitcher")
 
 /// Projection mode for panorama stitching
 enum ProjectionMode {
@@ -38,7 +41,7 @@ actor PanoramaStitcher {
             throw PanoramaError.notEnoughImages
         }
 
-        print("🧩 Starting panorama stitch with \(images.count) images (projection: \(projectionMode), exposure blending: \(useExposureBlending))")
+        logger.info("Stitching \(images.count) images (projection: \(String(describing: projectionMode), privacy: .public), exposure blending: \(useExposureBlending))")
 
         // Apply projection warping if needed
         let projectedImages: [CIImage]
@@ -62,21 +65,18 @@ actor PanoramaStitcher {
         // Blend images together
         let stitched = await blendImages(alignedImages, blendWidth: blendWidth)
 
-        print("✅ Panorama stitched successfully")
+        logger.info("Panorama stitched: \(Int(stitched.extent.width))×\(Int(stitched.extent.height))")
         return stitched
     }
 
     // MARK: - Cylindrical Projection
 
     private func applyCylindricalProjection(_ images: [CIImage]) async throws -> [CIImage] {
-        print("  🌐 Applying cylindrical projection...")
-
         var projectedImages: [CIImage] = []
 
-        for (index, image) in images.enumerated() {
+        for image in images {
             let projected = try await projectImageToCylinder(image)
             projectedImages.append(projected)
-            print("  ✓ Projected image \(index + 1)/\(images.count)")
         }
 
         return projectedImages
@@ -197,8 +197,6 @@ actor PanoramaStitcher {
             let alignedImage = current.transformed(by: transform)
 
             aligned.append(alignedImage)
-
-            print("  ✓ Aligned image \(i+1)/\(images.count) with offset: (\(offset.x), \(offset.y))")
         }
 
         return aligned
@@ -225,13 +223,13 @@ actor PanoramaStitcher {
         do {
             try handler.perform([request])
         } catch {
-            print("⚠️ Vision alignment failed, using fallback: \(error.localizedDescription)")
+            logger.notice("Vision alignment failed, using fallback: \(error.localizedDescription, privacy: .public)")
             return try await findAlignmentFallback(reference: reference, target: target)
         }
 
         // Get the alignment transform
         guard let observation = request.results?.first as? VNImageTranslationAlignmentObservation else {
-            print("⚠️ No alignment results, using fallback")
+            logger.notice("No alignment results, using fallback")
             return try await findAlignmentFallback(reference: reference, target: target)
         }
 
@@ -244,7 +242,7 @@ actor PanoramaStitcher {
         let xOffset = transform.tx * referenceExtent.width
         let yOffset = transform.ty * referenceExtent.height
 
-        print("  📐 Vision alignment: x=\(xOffset), y=\(yOffset), confidence=\(observation.confidence)")
+        logger.debug("Vision alignment: x=\(Double(xOffset)), y=\(Double(yOffset)), confidence=\(observation.confidence)")
 
         return CGPoint(x: xOffset, y: yOffset)
     }
@@ -313,8 +311,6 @@ actor PanoramaStitcher {
     private func compensateExposure(_ images: [CIImage]) async -> [CIImage] {
         guard images.count >= 2 else { return images }
 
-        print("  ☀️ Analyzing and compensating exposure...")
-
         var compensated: [CIImage] = [images[0]] // First image is reference
 
         for i in 1..<images.count {
@@ -330,7 +326,7 @@ actor PanoramaStitcher {
                     kCIInputEVKey: exposureDiff
                 ])
                 compensated.append(adjusted)
-                print("  ✓ Adjusted image \(i + 1) exposure by \(exposureDiff) EV")
+                logger.debug("Adjusted image \(i + 1) exposure by \(exposureDiff) EV")
             } else {
                 compensated.append(current)
             }
@@ -466,7 +462,6 @@ actor PanoramaStitcher {
                 kCIInputMaskImageKey: mask
             ])
 
-            print("  ✓ Blended image \(i+1)/\(images.count)")
         }
 
         return result
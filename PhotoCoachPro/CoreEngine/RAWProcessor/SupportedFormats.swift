@@ -62,16 +62,21 @@ struct RAWFormat {
         RAWFormat(fileExtension: "x3f", manufacturer: "Sigma", description: "Sigma X3F", supportsRAWFilter: true),
     ]
 
+    /// Extension → format, built once. When an extension appears more than once
+    /// (dng is both Adobe and Apple ProRAW) the first entry in `allFormats` wins.
+    private static let formatsByExtension: [String: RAWFormat] = Dictionary(
+        allFormats.map { ($0.fileExtension, $0) },
+        uniquingKeysWith: { first, _ in first }
+    )
+
     /// Check if file extension is a RAW format
     static func isRAWFormat(_ fileExtension: String) -> Bool {
-        let ext = fileExtension.lowercased()
-        return allFormats.contains { $0.fileExtension == ext }
+        formatsByExtension[fileExtension.lowercased()] != nil
     }
 
     /// Get RAW format info for extension
     static func format(for fileExtension: String) -> RAWFormat? {
-        let ext = fileExtension.lowercased()
-        return allFormats.first { $0.fileExtension == ext }
+        formatsByExtension[fileExtension.lowercased()]
     }
 
     /// All supported extensions
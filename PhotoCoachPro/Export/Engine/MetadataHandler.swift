@@ -56,7 +56,7 @@ actor MetadataHandler {
         // Read original metadata directly from source file via CGImageSource
         var originalMetadataProps: CFDictionary? = nil
         if !sourcePhoto.filePath.isEmpty {
-            let sourceURL = URL(fileURLWithPath: sourcePhoto.filePath)
+            let sourceURL = sourcePhoto.fileURL
             if let srcSource = CGImageSourceCreateWithURL(sourceURL as CFURL, nil) {
                 originalMetadataProps = CGImageSourceCopyPropertiesAtIndex(srcSource, 0, nil)
             }
@@ -92,12 +92,13 @@ actor MetadataHandler {
             throw ExportError.metadataHandlingFailed
         }
 
-        // Read original metadata from source file and strip GPS / IPTC
+        // Read original metadata from source file and strip GPS / IPTC.
+        // Only Exif and TIFF keys survive the filter, so the reader's header-only
+        // fast path is enough; it falls back to the full file when it is not.
         var filteredMetadataProps: CFDictionary? = nil
         if !sourcePhoto.filePath.isEmpty {
-            let sourceURL = URL(fileURLWithPath: sourcePhoto.filePath)
-            if let srcSource = CGImageSourceCreateWithURL(sourceURL as CFURL, nil),
-               let props = CGImageSourceCopyPropertiesAtIndex(srcSource, 0, nil) as? [String: Any] {
+            let sourceURL = sourcePhoto.fileURL
+            if let props = try? exifReader.readProperties(from: sourceURL) as? [String: Any] {
                 let filtered = filterToBasicMetadata(props)
                 filteredMetadataProps = filtered as CFDictionary
             }
@@ -234,25 +235,35 @@ actor MetadataHandler {
 
     /// Check if image data contains GPS information
     func containsGPSData(_ data: Data) -> Bool {
-        guard let metadata = extractMetadata(from: data) else {
+        guard let properties = copyProperties(from: data) else {
             return false
         }
 
-        return metadata[kCGImagePropertyGPSDictionary as String] != nil
+        return properties[kCGImagePropertyGPSDictionary] != nil
     }
 
     /// Get metadata summary
     func metadataSummary(from data: Data) -> MetadataSummary {
-        guard let metadata = extractMetadata(from: data) else {
+        guard let properties = copyProperties(from: data) else {
             return MetadataSummary(hasEXIF: false, hasGPS: false, hasIPTC: false)
         }
 
-        let hasEXIF = metadata[kCGImagePropertyExifDictionary as String] != nil
-        let hasGPS = metadata[kCGImagePropertyGPSDictionary as String] != nil
-        let hasIPTC = metadata[kCGImagePropertyIPTCDictionary as String] != nil
+        let hasEXIF = properties[kCGImagePropertyExifDictionary] != nil
+        let hasGPS = properties[kCGImagePropertyGPSDictionary] != nil
+        let hasIPTC = properties[kCGImagePropertyIPTCDictionary] != nil
 
         return MetadataSummary(hasEXIF: hasEXIF, hasGPS: hasGPS, hasIPTC: hasIPTC)
     }
+
+    /// Properties as an unbridged NSDictionary. The presence checks above only need
+    /// key lookups, so there is no reason to convert the GPS, EXIF and MakerNote
+    /// sub-dictionaries into Swift values the way `extractMetadata` does.
+    private func copyProperties(from data: Data) -> NSDictionary? {
+        guard let imageSource = CGImageSourceCreateWithData(data as CFData, nil) else {
+            return nil
+        }
+        return CGImageSourceCopyPropertiesAtIndex(imageSource, 0, nil) as NSDictionary?
+    }
 }
 
 // MARK: - Metadata Summary
@@ -113,8 +113,30 @@ extension PhotoRecord {
         }
     }
 
+    /// Copies of photos received from the photo picker are stored with a path
+    /// relative to `importsDirectory`, because the absolute container path can
+    /// change across app updates and device restores.
     var fileURL: URL {
-        URL(fileURLWithPath: filePath)
+        if filePath.hasPrefix("/") {
+            return URL(fileURLWithPath: filePath)
+        }
+        return Self.importsDirectory.appendingPathComponent(filePath)
+    }
+
+    /// Directory holding the app's own copies of imported photos
+    static var importsDirectory: URL {
+        URL.applicationSupportDirectory
+            .appendingPathComponent("PhotoCoachPro", isDirectory: true)
+            .appendingPathComponent("Imported", isDirectory: true)
+    }
+
+    /// The value to store in `filePath` for a file at `url`: relative for files
+    /// inside `importsDirectory`, absolute for everything else
+    static func storedPath(for url: URL) -> String {
+        let directory = importsDirectory.standardizedFileURL.path + "/"
+        let path = url.standardizedFileURL.path
+        guard path.hasPrefix(directory) else { return path }
+        return String(path.dropFirst(directory.count))
     }
 
     var fileSizeMB: Double {
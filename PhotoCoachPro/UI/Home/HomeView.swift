@@ -61,8 +61,10 @@ struct HomeView: View {
                 Task {
                     guard let newItem else { return }
                     do {
-                        guard let data = try await newItem.loadTransferable(type: Data.self) else { return }
-                        await appState.importPhotoFromPickerData(data)
+                        // Received as a file so large originals are streamed to disk
+                        // rather than held in memory as Data
+                        guard let picked = try await newItem.loadTransferable(type: PickedImageFile.self) else { return }
+                        await appState.importPhotoFromFileSystem(url: picked.url, bookmarkData: nil)
                     } catch {
                         appState.errorMessage = "Failed to load photo: \(error.localizedDescription)"
                     }
@@ -232,6 +234,36 @@ struct HomeView: View {
     }
 }
 
+// MARK: - Picked Image File
+
+/// A photo received from PhotosPicker as a file.
+/// The system hands over a temporary file which is copied into the app's
+/// imports directory, so the original is never loaded into memory.
+struct PickedImageFile: Transferable {
+    let url: URL
+
+    static var transferRepresentation: some TransferRepresentation {
+        FileRepresentation(importedContentType: .image) { received in
+            let directory = try PickedImageFile.importsDirectory()
+            let name = received.file.lastPathComponent
+
+            var destination = directory.appendingPathComponent(name)
+            if FileManager.default.fileExists(atPath: destination.path) {
+                destination = directory.appendingPathComponent("\(UUID().uuidString.prefix(8))-\(name)")
+            }
+
+            try FileManager.default.copyItem(at: received.file, to: destination)
+            return PickedImageFile(url: destination)
+        }
+    }
+
+    private static func importsDirectory() throws -> URL {
+        let dir = PhotoRecord.importsDirectory
+        try FileManager.default.createDirectory(at: dir, withIntermediateDirectories: true)
+        return dir
+    }
+}
+
 // MARK: - Stat Card
 
 struct StatCard: View {
@@ -8,6 +8,9 @@
 import SwiftUI
 import SwiftData
 import CoreImage
+import OSLog
+
+private let logger = Logger(subsystem: "com.photocoachpro", category: "PanoramaStitchingView")
 
 struct PanoramaStitchingView: View {
     @EnvironmentObject var appState: AppState
@@ -348,8 +351,7 @@ struct PanoramaStitchingView: View {
                     return date1 < date2
                 }
 
-                print("🤖 Auto-stitching \(orderedPhotos.count) photos")
-                print("   Order: \(orderedPhotos.map { $0.fileName }.joined(separator: " → "))")
+                logger.info("Auto-stitching \(orderedPhotos.count) photos: \(orderedPhotos.map { $0.fileName }.joined(separator: " → "), privacy: .private)")
 
                 // Load images (no rotation for auto mode)
                 var images: [CIImage] = []
@@ -369,7 +371,7 @@ struct PanoramaStitchingView: View {
                 await MainActor.run {
                     stitchedImage = stitched
                     isStitching = false
-                    print("✅ Auto-stitch complete: \(Int(stitched.extent.width))×\(Int(stitched.extent.height))")
+                    logger.info("Auto-stitch complete: \(Int(stitched.extent.width))×\(Int(stitched.extent.height))")
                 }
 
             } catch {
@@ -402,7 +404,7 @@ struct PanoramaStitchingView: View {
                     if let rotation = photoRotations[photo.id], rotation != 0 {
                         let radians = rotation * .pi / 180.0
                         image = image.transformed(by: CGAffineTransform(rotationAngle: radians))
-                        print("  🔄 Rotated image \(photo.id) by \(rotation)°")
+                        logger.debug("Rotated image \(photo.id.uuidString, privacy: .public) by \(rotation)°")
                     }
 
                     images.append(image)
@@ -572,7 +574,7 @@ private struct PhotoSelectionCard: View {
                 }
             }
         } catch {
-            print("⚠️ Failed to load thumbnail for \(photo.fileURL.lastPathComponent): \(error)")
+            logger.error("Failed to load thumbnail for \(photo.fileURL.lastPathComponent, privacy: .private): \(error.localizedDescription, privacy: .public)")
             await MainActor.run {
                 self.isLoading = false
             }
@@ -126,13 +126,32 @@ struct PhotoGridItem: View {
     // MARK: - Thumbnail Loading
 
     private func loadThumbnail() async {
+        let cache = appState.thumbnailCache
+        let cacheKey = ThumbnailCache.CacheKey(photoID: photo.id, editStack: [])
+
+        if let cached = await cache.thumbnail(for: cacheKey) {
+            await MainActor.run {
+                self.thumbnail = cached
+            }
+            return
+        }
+
         do {
+            // File-backed photos decode straight to thumbnail size
+            let maxPixelSize = Int(max(cache.thumbnailSize.width, cache.thumbnailSize.height))
+            if let decoded = try await appState.imageLoader.loadThumbnail(for: photo, maxPixelSize: maxPixelSize) {
+                let thumb = await cache.setThumbnail(decoded, for: cacheKey)
+                await MainActor.run {
+                    self.thumbnail = thumb
+                }
+                return
+            }
+
             // Load image via unified router (supports Photos library, bookmarks, and legacy file paths)
             let loaded = try await appState.imageLoader.loadImage(for: photo)
 
             // Generate thumbnail
-            let cacheKey = ThumbnailCache.CacheKey(photoID: photo.id, editStack: [])
-            if let thumb = await appState.thumbnailCache.generateThumbnail(from: loaded.image, for: cacheKey) {
+            if let thumb = await cache.generateThumbnail(from: loaded.image, for: cacheKey) {
                 await MainActor.run {
                     self.thumbnail = thumb
                 }
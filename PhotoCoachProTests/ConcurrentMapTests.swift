@@ -0,0 +1,61 @@
+//
+//  ConcurrentMapTests.swift
+//  PhotoCoachProTests
+//
+
+import XCTest
+@testable import PhotoCoachPro
+
+final class ConcurrentMapTests: XCTestCase {
+
+    func testResultsKeepInputOrder() async throws {
+        // Later elements finish first, so completion order is the reverse of input order
+        let values = Array(0..<8)
+        let results = try await values.concurrentMap(maxConcurrent: 4) { value -> Int in
+            try await Task.sleep(nanoseconds: UInt64(8 - value) * 2_000_000)
+            return value * 10
+        }
+        XCTAssertEqual(results, values.map { $0 * 10 })
+    }
+
+    func testNeverExceedsConcurrencyLimit() async throws {
+        let tracker = InFlightTracker()
+        _ = try await Array(0..<12).concurrentMap(maxConcurrent: 3) { _ -> Void in
+            await tracker.enter()
+            try await Task.sleep(nanoseconds: 2_000_000)
+            await tracker.leave()
+        }
+        let peak = await tracker.peak
+        XCTAssertLessThanOrEqual(peak, 3)
+        XCTAssertGreaterThan(peak, 0)
+    }
+
+    func testFirstErrorIsRethrown() async {
+        struct Failure: Error {}
+        do {
+            _ = try await Array(0..<5).concurrentMap(maxConcurrent: 2) { value -> Int in
+                if value == 3 { throw Failure() }
+                return value
+            }
+            XCTFail("Expected the transform's error")
+        } catch {
+            XCTAssertTrue(error is Failure)
+        }
+    }
+
+    // MARK: - Helpers
+
+    private actor InFlightTracker {
+        private(set) var peak = 0
+        private var current = 0
+
+        func enter() {
+            current += 1
+            peak = max(peak, current)
+        }
+
+        func leave() {
+            current -= 1
+        }
+    }
+}
@@ -0,0 +1,196 @@
+//
+//  EXIFReaderTests.swift
+//  PhotoCoachProTests
+//
+
+import XCTest
+import ImageIO
+import UniformTypeIdentifiers
+@testable import PhotoCoachPro
+
+final class EXIFReaderTests: XCTestCase {
+
+    private let reader = EXIFReader()
+    private var fileURLs: [URL] = []
+
+    override func tearDown() {
+        fileURLs.forEach { try? FileManager.default.removeItem(at: $0) }
+        super.tearDown()
+    }
+
+    // MARK: - Header Fast Path
+
+    func testHeaderReadMatchesFullRead() throws {
+        // Noise keeps the JPEG well past the 128 KB header window
+        let url = try writeJPEG(width: 640, height: 480, make: "HeaderCam", noise: true)
+        XCTAssertGreaterThan(try Data(contentsOf: url).count, 128 * 1024)
+
+        let header = try XCTUnwrap(reader.headerProperties(of: url))
+        let full = try reader.fullProperties(of: url)
+
+        XCTAssertEqual(header[kCGImagePropertyPixelWidth] as? Int, full[kCGImagePropertyPixelWidth] as? Int)
+        XCTAssertEqual(header[kCGImagePropertyPixelHeight] as? Int, full[kCGImagePropertyPixelHeight] as? Int)
+        let headerTIFF = try XCTUnwrap(header[kCGImagePropertyTIFFDictionary] as? NSDictionary)
+        let fullTIFF = try XCTUnwrap(full[kCGImagePropertyTIFFDictionary] as? NSDictionary)
+        XCTAssertEqual(headerTIFF[kCGImagePropertyTIFFMake] as? String, "HeaderCam")
+        XCTAssertEqual(fullTIFF[kCGImagePropertyTIFFMake] as? String, "HeaderCam")
+    }
+
+    func testTypeWithoutEXIFSkipsHeaderRead() throws {
+        let url = try writeImage(width: 16, height: 16, type: .png, properties: [:], noise: false)
+
+        XCTAssertNil(reader.headerProperties(of: url))
+        let properties = try reader.readProperties(from: url)
+        XCTAssertEqual(properties[kCGImagePropertyPixelWidth] as? Int, 16)
+    }
+
+    func testIFDsInsideHeaderAreAccepted() {
+        XCTAssertTrue(EXIFReader.referencedIFDsAreInHeader(tiffHeader(exifIFDOffset: 26, length: 64)))
+    }
+
+    func testExifIFDPastHeaderForcesFullRead() {
+        // A RAW whose Exif IFD sits beyond the bytes that were read
+        XCTAssertFalse(EXIFReader.referencedIFDsAreInHeader(tiffHeader(exifIFDOffset: 200_000, length: 64)))
+    }
+
+    // MARK: - Orientation
+
+    func testRotatedOrientationSwapsDimensions() async throws {
+        let url = try writeJPEG(width: 64, height: 32, make: "Rotated", orientation: 6)
+
+        let exif = try await reader.readMetadata(from: url).exif
+        XCTAssertEqual(exif?.pixelWidth, 32)
+        XCTAssertEqual(exif?.pixelHeight, 64)
+    }
+
+    func testUprightOrientationKeepsDimensions() async throws {
+        let url = try writeJPEG(width: 64, height: 32, make: "Upright", orientation: 1)
+
+        let exif = try await reader.readMetadata(from: url).exif
+        XCTAssertEqual(exif?.pixelWidth, 64)
+        XCTAssertEqual(exif?.pixelHeight, 32)
+    }
+
+    func testLoaderReportsOrientedDimensions() async throws {
+        let url = try writeJPEG(width: 64, height: 32, make: "Loaded", orientation: 6)
+        let loader = ImageLoader(colorSpaceManager: ColorSpaceManager(), exifReader: reader)
+
+        let loaded = try await loader.load(from: url)
+        XCTAssertEqual(loaded.metadata?.cameraMake, "Loaded")
+        XCTAssertEqual(loaded.metadata?.pixelWidth, 32)
+        XCTAssertEqual(loaded.metadata?.pixelHeight, 64)
+        XCTAssertEqual(Int(loaded.image.extent.width), 32)
+    }
+
+    // MARK: - Cache
+
+    func testRepeatedLoadsShareOneCacheEntry() async throws {
+        let url = try writeJPEG(width: 32, height: 32, make: "Cached")
+        let loader = ImageLoader(colorSpaceManager: ColorSpaceManager(), exifReader: reader)
+
+        _ = try await loader.load(from: url)
+        let reloaded = try await loader.load(from: url)
+        let count = await reader.cachedMetadataCount()
+        XCTAssertEqual(count, 1)
+        XCTAssertEqual(reloaded.metadata?.cameraMake, "Cached")
+    }
+
+    func testRewrittenFileIsNotServedFromCache() async throws {
+        let url = try writeJPEG(width: 32, height: 32, make: "First")
+        let first = try await reader.readMetadata(from: url)
+        XCTAssertEqual(first.exif?.cameraMake, "First")
+
+        // Different dimensions guarantee a different file size
+        try writeJPEG(width: 48, height: 40, make: "Second", to: url)
+        let second = try await reader.readMetadata(from: url)
+        XCTAssertEqual(second.exif?.cameraMake, "Second")
+        XCTAssertEqual(second.exif?.pixelWidth, 48)
+    }
+
+    // MARK: - Helpers
+
+    /// Little-endian TIFF header whose IFD0 holds a single Exif IFD pointer.
+    /// An empty IFD is written at offset 26, right after IFD0.
+    private func tiffHeader(exifIFDOffset: UInt32, length: Int) -> Data {
+        func le16(_ value: UInt16) -> [UInt8] { [UInt8(value & 0xFF), UInt8(value >> 8)] }
+        func le32(_ value: UInt32) -> [UInt8] { (0..<4).map { UInt8((value >> (8 * $0)) & 0xFF) } }
+
+        var bytes: [UInt8] = [0x49, 0x49, 0x2A, 0x00] + le32(8)
+        bytes += le16(1)                                            // IFD0: one entry
+        bytes += le16(0x8769) + le16(4) + le32(1) + le32(exifIFDOffset)
+        bytes += le32(0)                                            // no next IFD
+        bytes += le16(0) + le32(0)                                  // empty IFD at 26
+        bytes += [UInt8](repeating: 0, count: max(0, length - bytes.count))
+        return Data(bytes)
+    }
+
+    @discardableResult
+    private func writeJPEG(
+        width: Int,
+        height: Int,
+        make: String,
+        orientation: Int = 1,
+        noise: Bool = false,
+        to url: URL? = nil
+    ) throws -> URL {
+        let properties: [CFString: Any] = [
+            kCGImagePropertyOrientation: orientation,
+            kCGImageDestinationLossyCompressionQuality: 1.0,
+            kCGImagePropertyTIFFDictionary: [
+                kCGImagePropertyTIFFMake: make,
+                kCGImagePropertyTIFFModel: "Test Model"
+            ],
+            kCGImagePropertyExifDictionary: [
+                kCGImagePropertyExifFNumber: 2.8,
+                kCGImagePropertyExifISOSpeedRatings: [200]
+            ]
+        ]
+        return try writeImage(width: width, height: height, type: .jpeg, properties: properties, noise: noise, to: url)
+    }
+
+    private func writeImage(
+        width: Int,
+        height: Int,
+        type: UTType,
+        properties: [CFString: Any],
+        noise: Bool,
+        to existingURL: URL? = nil
+    ) throws -> URL {
+        // Deterministic pixels: flat gray, or LCG noise that JPEG cannot compress well
+        var state: UInt32 = 12345
+        var pixels = [UInt8](repeating: 128, count: width * height * 4)
+        if noise {
+            for i in pixels.indices {
+                state = state &* 1_664_525 &+ 1_013_904_223
+                pixels[i] = UInt8(truncatingIfNeeded: state >> 24)
+            }
+        }
+
+        let provider = try XCTUnwrap(CGDataProvider(data: Data(pixels) as CFData))
+        let image = try XCTUnwrap(CGImage(
+            width: width,
+            height: height,
+            bitsPerComponent: 8,
+            bitsPerPixel: 32,
+            bytesPerRow: width * 4,
+            space: try XCTUnwrap(CGColorSpace(name: CGColorSpace.sRGB)),
+            bitmapInfo: CGBitmapInfo(rawValue: CGImageAlphaInfo.noneSkipLast.rawValue),
+            provider: provider,
+            decode: nil,
+            shouldInterpolate: false,
+            intent: .defaultIntent
+        ))
+
+        let url = existingURL ?? FileManager.default.temporaryDirectory
+            .appendingPathComponent("exif-reader-\(UUID().uuidString)")
+            .appendingPathExtension(type.preferredFilenameExtension ?? "img")
+        let destination = try XCTUnwrap(CGImageDestinationCreateWithURL(url as CFURL, type.identifier as CFString, 1, nil))
+        CGImageDestinationAddImage(destination, image, properties as CFDictionary)
+        XCTAssertTrue(CGImageDestinationFinalize(destination))
+
+        if existingURL == nil {
+            fileURLs.append(url)
+        }
+        return url
+    }
+}
@@ -0,0 +1,36 @@
+//
+//  ImageAnalyzerTests.swift
+//  PhotoCoachProTests
+//
+
+import XCTest
+import CoreImage
+@testable import PhotoCoachPro
+
+final class ImageAnalyzerTests: XCTestCase {
+
+    private let analyzer = ImageAnalyzer()
+
+    func testBatchResultsKeepInputOrder() async throws {
+        let items = (0..<3).map { index in
+            (image: gradient(brightness: CGFloat(index + 1) / 4), photoID: UUID())
+        }
+
+        let results = try await analyzer.analyzeBatch(items, maxConcurrent: 2)
+
+        XCTAssertEqual(results.map(\.photoID), items.map(\.photoID))
+    }
+
+    // MARK: - Helpers
+
+    /// A left-to-right gradient, so Vision and the edge filters have structure to find
+    private func gradient(brightness: CGFloat, size: CGFloat = 128) -> CIImage {
+        let filter = CIFilter(name: "CILinearGradient", parameters: [
+            "inputPoint0": CIVector(x: 0, y: 0),
+            "inputPoint1": CIVector(x: size, y: 0),
+            "inputColor0": CIColor(red: 0, green: 0, blue: 0),
+            "inputColor1": CIColor(red: brightness, green: brightness, blue: brightness)
+        ])!
+        return filter.outputImage!.cropped(to: CGRect(x: 0, y: 0, width: size, height: size))
+    }
+}
@@ -0,0 +1,44 @@
+//
+//  LRUCacheTests.swift
+//  PhotoCoachProTests
+//
+
+import XCTest
+@testable import PhotoCoachPro
+
+final class LRUCacheTests: XCTestCase {
+
+    func testEvictsLeastRecentlyUsedEntry() {
+        var cache = LRUCache<String, Int>(capacity: 2)
+        cache.setValue(1, for: "a")
+        cache.setValue(2, for: "b")
+
+        // Reading "a" makes "b" the oldest entry
+        XCTAssertEqual(cache.value(for: "a"), 1)
+        cache.setValue(3, for: "c")
+
+        XCTAssertEqual(cache.count, 2)
+        XCTAssertNil(cache.value(for: "b"))
+        XCTAssertEqual(cache.value(for: "a"), 1)
+        XCTAssertEqual(cache.value(for: "c"), 3)
+    }
+
+    func testReplacingAValueDoesNotEvict() {
+        var cache = LRUCache<String, Int>(capacity: 2)
+        cache.setValue(1, for: "a")
+        cache.setValue(2, for: "b")
+        cache.setValue(10, for: "a")
+
+        XCTAssertEqual(cache.count, 2)
+        XCTAssertEqual(cache.value(for: "a"), 10)
+        XCTAssertEqual(cache.value(for: "b"), 2)
+    }
+
+    func testRemoveAll() {
+        var cache = LRUCache<String, Int>(capacity: 2)
+        cache.setValue(1, for: "a")
+        cache.removeAll()
+        XCTAssertEqual(cache.count, 0)
+        XCTAssertNil(cache.value(for: "a"))
+    }
+}
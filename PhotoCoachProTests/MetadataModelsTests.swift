@@ -0,0 +1,65 @@
+//
+//  MetadataModelsTests.swift
+//  PhotoCoachProTests
+//
+
+import XCTest
+@testable import PhotoCoachPro
+
+final class MetadataModelsTests: XCTestCase {
+
+    // MARK: - Date parsing
+
+    func testParsesEXIFTimestamp() throws {
+        let date = try XCTUnwrap(EXIFData.parseDate("2024:06:01 14:30:05"))
+        var calendar = Calendar(identifier: .gregorian)
+        calendar.timeZone = TimeZone.current
+        let parts = calendar.dateComponents([.year, .month, .day, .hour, .minute, .second], from: date)
+        XCTAssertEqual(parts.year, 2024)
+        XCTAssertEqual(parts.month, 6)
+        XCTAssertEqual(parts.day, 1)
+        XCTAssertEqual(parts.hour, 14)
+        XCTAssertEqual(parts.minute, 30)
+        XCTAssertEqual(parts.second, 5)
+    }
+
+    func testRejectsNonEXIFTimestamp() {
+        XCTAssertNil(EXIFData.parseDate("2024-06-01T14:30:05Z"))
+        XCTAssertNil(EXIFData.parseDate(""))
+    }
+
+    // MARK: - Text normalization
+
+    func testStripsNULAndSpacePadding() {
+        XCTAssertEqual(EXIFData.normalizedText("Canon\0\0\0"), "Canon")
+        XCTAssertEqual(EXIFData.normalizedText("  NIKON CORPORATION  "), "NIKON CORPORATION")
+        XCTAssertEqual(EXIFData.normalizedText("EOS R5\0 \n"), "EOS R5")
+    }
+
+    func testBlankOrNonStringValuesBecomeNil() {
+        XCTAssertNil(EXIFData.normalizedText("\0\0 "))
+        XCTAssertNil(EXIFData.normalizedText(""))
+        XCTAssertNil(EXIFData.normalizedText(42))
+        XCTAssertNil(EXIFData.normalizedText(nil))
+    }
+
+    // MARK: - Exposure time
+
+    func testFractionalExposureRoundsToNearestDenominator() {
+        XCTAssertEqual(EXIFData.formattedExposureTime(1.0 / 3.0), "1/3")
+        XCTAssertEqual(EXIFData.formattedExposureTime(0.004), "1/250")
+        XCTAssertEqual(EXIFData.formattedExposureTime(1.0 / 8000.0), "1/8000")
+    }
+
+    func testLongExposureUsesSeconds() {
+        XCTAssertEqual(EXIFData.formattedExposureTime(1), "1.0s")
+        XCTAssertEqual(EXIFData.formattedExposureTime(2.5), "2.5s")
+    }
+
+    func testInvalidExposureIsNil() {
+        XCTAssertNil(EXIFData.formattedExposureTime(0))
+        XCTAssertNil(EXIFData.formattedExposureTime(-0.01))
+        XCTAssertNil(EXIFData.formattedExposureTime(.infinity))
+        XCTAssertNil(EXIFData.formattedExposureTime(.nan))
+    }
+}
@@ -0,0 +1,29 @@
+//
+//  PhotoRecordTests.swift
+//  PhotoCoachProTests
+//
+
+import XCTest
+@testable import PhotoCoachPro
+
+final class PhotoRecordTests: XCTestCase {
+
+    // MARK: - Stored paths
+
+    func testImportedCopyIsStoredRelativeToImportsDirectory() {
+        let url = PhotoRecord.importsDirectory.appendingPathComponent("IMG_0001.heic")
+        XCTAssertEqual(PhotoRecord.storedPath(for: url), "IMG_0001.heic")
+    }
+
+    func testExternalFileKeepsAbsolutePath() {
+        let url = URL(fileURLWithPath: "/tmp/panorama.jpg")
+        XCTAssertEqual(PhotoRecord.storedPath(for: url), url.standardizedFileURL.path)
+    }
+
+    func testRelativePathResolvesAgainstImportsDirectory() {
+        let photo = PhotoRecord(filePath: "IMG_0001.heic", fileName: "IMG_0001.heic",
+                                width: 1, height: 1, fileFormat: "heic", fileSizeBytes: 0)
+        XCTAssertEqual(photo.fileURL,
+                       PhotoRecord.importsDirectory.appendingPathComponent("IMG_0001.heic"))
+    }
+}
@@ -0,0 +1,179 @@
+//
+//  QuickMetricsAnalyzerTests.swift
+//  PhotoCoachProTests
+//
+
+import XCTest
+import ImageIO
+import CoreImage
+import UniformTypeIdentifiers
+@testable import PhotoCoachPro
+
+final class QuickMetricsAnalyzerTests: XCTestCase {
+
+    private let analyzer = QuickMetricsAnalyzer()
+
+    // MARK: - Color
+
+    func testNeutralGrayHasNoSaturationOrCast() async throws {
+        let metrics = try await analyzer.analyzeColor(solid(r: 128, g: 128, b: 128))
+        XCTAssertEqual(metrics.saturationMean, 0, accuracy: 0.0001)
+        XCTAssertEqual(metrics.saturationP95, 0, accuracy: 0.0001)
+        XCTAssertEqual(metrics.warmth, 0, accuracy: 0.0001)
+        XCTAssertEqual(metrics.greenMagenta, 0, accuracy: 0.0001)
+    }
+
+    func testPureRedIsFullySaturatedAndWarm() async throws {
+        let metrics = try await analyzer.analyzeColor(solid(r: 255, g: 0, b: 0))
+        XCTAssertEqual(metrics.meanRGB[0], 255, accuracy: 0.0001)
+        XCTAssertEqual(metrics.saturationMean, 1, accuracy: 0.0001)
+        XCTAssertGreaterThan(metrics.warmth, 18)
+    }
+
+    // MARK: - Sharpness
+
+    func testFlatImageHasZeroLaplacianVariance() async throws {
+        let metrics = try await analyzer.analyzeSharpness(solid(r: 90, g: 90, b: 90))
+        XCTAssertEqual(metrics.laplacianVariance, 0, accuracy: 0.0001)
+    }
+
+    func testCheckerboardIsSharperThanFlat() async throws {
+        let flat = try await analyzer.analyzeSharpness(solid(r: 128, g: 128, b: 128))
+        let checker = try await analyzer.analyzeSharpness(checkerboard())
+        XCTAssertGreaterThan(checker.laplacianVariance, flat.laplacianVariance)
+        XCTAssertGreaterThan(checker.score, flat.score)
+    }
+
+    // MARK: - Exposure
+
+    func testMidGrayExposure() async throws {
+        let metrics = try await analyzer.analyzeExposure(solid(r: 128, g: 128, b: 128))
+        XCTAssertEqual(metrics.brightnessMean, 128, accuracy: 0.0001)
+        XCTAssertEqual(metrics.clippedShadows, 0, accuracy: 0.0001)
+        XCTAssertEqual(metrics.clippedHighlights, 0, accuracy: 0.0001)
+    }
+
+    func testPureWhiteIsFullyClipped() async throws {
+        let metrics = try await analyzer.analyzeExposure(solid(r: 255, g: 255, b: 255))
+        XCTAssertEqual(metrics.clippedHighlights, 100, accuracy: 0.0001)
+        XCTAssertEqual(metrics.brightnessP95, 255, accuracy: 0.0001)
+    }
+
+    // MARK: - Encoded Input
+
+    func testEncodedImageDecodesThroughImageIO() async throws {
+        let data = try encoded(solid(r: 128, g: 128, b: 128))
+        let result = try await analyzer.analyze(imageData: data)
+        XCTAssertEqual(result.exposure.brightnessMean, 128, accuracy: 1)
+        XCTAssertEqual(result.color.saturationMean, 0, accuracy: 0.01)
+        XCTAssertEqual(result.sharpness.laplacianVariance, 0, accuracy: 0.0001)
+    }
+
+    func testRenderedAndDecodedImagesScoreAlike() async throws {
+        let bitmap = solid(r: 200, g: 120, b: 60)
+        let rendered = try await analyzer.analyze(CIImage(cgImage: cgImage(bitmap)))
+        let decoded = try await analyzer.analyze(imageData: encoded(bitmap))
+        for channel in 0..<3 {
+            XCTAssertEqual(rendered.color.meanRGB[channel], decoded.color.meanRGB[channel], accuracy: 1)
+        }
+        XCTAssertEqual(rendered.exposure.brightnessMean, decoded.exposure.brightnessMean, accuracy: 1)
+    }
+
+    func testLargeSourceShrinksOnLoad() throws {
+        let data = try encoded(solid(r: 128, g: 128, b: 128, width: 3000, height: 1500))
+        let bitmap = try analyzer.decodeBitmap { CGImageSourceCreateWithData(data as CFData, nil) }
+        XCTAssertEqual(bitmap.width, 1400)
+        XCTAssertEqual(bitmap.height, 700)
+    }
+
+    // MARK: - Result Cache
+
+    func testRepeatedImageDataIsServedFromCache() async throws {
+        let gray = try encoded(solid(r: 128, g: 128, b: 128))
+        let first = try await analyzer.analyze(imageData: gray)
+        let second = try await analyzer.analyze(imageData: gray)
+        let count = await analyzer.cachedResultCount()
+        XCTAssertEqual(count, 1)
+        XCTAssertEqual(second.overallScore, first.overallScore)
+
+        _ = try await analyzer.analyze(imageData: try encoded(solid(r: 255, g: 255, b: 255)))
+        let countAfterNewImage = await analyzer.cachedResultCount()
+        XCTAssertEqual(countAfterNewImage, 2)
+    }
+
+    func testFileResultIsCachedUntilTheFileChanges() async throws {
+        let url = FileManager.default.temporaryDirectory
+            .appendingPathComponent("quick-metrics-\(UUID().uuidString).png")
+        defer { try? FileManager.default.removeItem(at: url) }
+
+        try encoded(solid(r: 128, g: 128, b: 128)).write(to: url)
+        let first = try await analyzer.analyze(contentsOf: url)
+        _ = try await analyzer.analyze(contentsOf: url)
+        let count = await analyzer.cachedResultCount()
+        XCTAssertEqual(count, 1)
+
+        // A rewrite changes the size and modification date, so it is a new entry
+        try encoded(solid(r: 255, g: 255, b: 255, width: 48, height: 48)).write(to: url)
+        let rewritten = try await analyzer.analyze(contentsOf: url)
+        let countAfterRewrite = await analyzer.cachedResultCount()
+        XCTAssertEqual(countAfterRewrite, 2)
+        XCTAssertEqual(first.exposure.brightnessMean, 128, accuracy: 1)
+        XCTAssertEqual(rewritten.exposure.brightnessMean, 255, accuracy: 1)
+    }
+
+    // MARK: - Helpers
+
+    private func solid(r: UInt8, g: UInt8, b: UInt8, size: Int = 32) -> AnalysisBitmap {
+        solid(r: r, g: g, b: b, width: size, height: size)
+    }
+
+    private func solid(r: UInt8, g: UInt8, b: UInt8, width: Int, height: Int) -> AnalysisBitmap {
+        var pixels: [UInt8] = []
+        pixels.reserveCapacity(width * height * 4)
+        for _ in 0..<(width * height) {
+            pixels.append(contentsOf: [r, g, b, 255])
+        }
+        return AnalysisBitmap(pixels: pixels, width: width, height: height)
+    }
+
+    private func checkerboard(size: Int = 32) -> AnalysisBitmap {
+        var pixels: [UInt8] = []
+        pixels.reserveCapacity(size * size * 4)
+        for y in 0..<size {
+            for x in 0..<size {
+                let v: UInt8 = (x + y) % 2 == 0 ? 0 : 255
+                pixels.append(contentsOf: [v, v, v, 255])
+            }
+        }
+        return AnalysisBitmap(pixels: pixels, width: size, height: size)
+    }
+
+    /// Encodes a bitmap as an sRGB-tagged PNG
+    private func encoded(_ bitmap: AnalysisBitmap) throws -> Data {
+        let image = try cgImage(bitmap)
+        let data = NSMutableData()
+        let destination = try XCTUnwrap(CGImageDestinationCreateWithData(data, UTType.png.identifier as CFString, 1, nil))
+        CGImageDestinationAddImage(destination, image, nil)
+        XCTAssertTrue(CGImageDestinationFinalize(destination))
+        return data as Data
+    }
+
+    /// Wraps a bitmap in an sRGB-tagged CGImage
+    private func cgImage(_ bitmap: AnalysisBitmap) throws -> CGImage {
+        let provider = try XCTUnwrap(CGDataProvider(data: Data(bitmap.pixels) as CFData))
+        let image = try XCTUnwrap(CGImage(
+            width: bitmap.width,
+            height: bitmap.height,
+            bitsPerComponent: 8,
+            bitsPerPixel: 32,
+            bytesPerRow: bitmap.width * 4,
+            space: try XCTUnwrap(CGColorSpace(name: CGColorSpace.sRGB)),
+            bitmapInfo: CGBitmapInfo(rawValue: CGImageAlphaInfo.noneSkipLast.rawValue),
+            provider: provider,
+            decode: nil,
+            shouldInterpolate: false,
+            intent: .defaultIntent
+        ))
+        return image
+    }
+}
@@ -0,0 +1,31 @@
+//
+//  SupportedFormatsTests.swift
+//  PhotoCoachProTests
+//
+
+import XCTest
+@testable import PhotoCoachPro
+
+final class SupportedFormatsTests: XCTestCase {
+
+    func testLookupIsCaseInsensitive() {
+        XCTAssertTrue(RAWFormat.isRAWFormat("NEF"))
+        XCTAssertEqual(RAWFormat.format(for: "Cr3")?.manufacturer, "Canon")
+    }
+
+    func testNonRAWExtensionsAreRejected() {
+        XCTAssertFalse(RAWFormat.isRAWFormat("jpg"))
+        XCTAssertNil(RAWFormat.format(for: "heic"))
+    }
+
+    func testDuplicateExtensionResolvesToFirstEntry() {
+        // dng is listed for both Adobe and Apple ProRAW; Adobe comes first
+        XCTAssertEqual(RAWFormat.format(for: "dng")?.manufacturer, "Adobe")
+    }
+
+    func testEveryListedExtensionIsRecognised() {
+        for format in RAWFormat.allFormats {
+            XCTAssertTrue(RAWFormat.isRAWFormat(format.fileExtension), format.fileExtension)
+        }
+    }
+}
@@ -45,6 +45,14 @@ tests_group = project.main_group.new_group('PhotoCoachProTests', 'PhotoCoachProT
   CritiqueResultTests.swift
   WeeklyFocusPlanTests.swift
   SkillHistoryTests.swift
+  QuickMetricsAnalyzerTests.swift
+  SupportedFormatsTests.swift
+  EXIFReaderTests.swift
+  ImageAnalyzerTests.swift
+  MetadataModelsTests.swift
+  ConcurrentMapTests.swift
+  PhotoRecordTests.swift
+  LRUCacheTests.swift
 ].each do |filename|
   ref = tests_group.new_file(filename)
   test_target.source_build_phase.add_file_reference(ref)